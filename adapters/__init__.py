@@ -1,14 +1,94 @@
+import asyncio
+from collections.abc import Mapping
+from importlib import import_module
 from .base import BaseAdapter, Prospect
-from .github import GitHubAdapter
-from .hn import HackerNewsAdapter
-from .x_twitter import XTwitterAdapter
-from .bootcamps import BootcampAdapter
-from .gaming_platforms import GamingPlatformAdapter
-
-ADAPTERS = {
-    "github": GitHubAdapter,
-    "hackernews": HackerNewsAdapter,
-    "x_twitter": XTwitterAdapter,
-    "bootcamps": BootcampAdapter,
-    "gaming_platforms": GamingPlatformAdapter,
+
+__all__ = [
+    "ADAPTERS",
+    "BaseAdapter",
+    "Prospect",
+    "GitHubAdapter",
+    "HackerNewsAdapter",
+    "XTwitterAdapter",
+    "BootcampAdapter",
+    "GamingPlatformAdapter",
+    "fetch_all",
+    "fetch_each",
+]
+
+# adapter key -> (submodule, class name). Submodules are imported on first use
+# so that e.g. listing bootcamps doesn't pay for httpx and the network adapters.
+_ADAPTER_MODULES = {
+    "github": ("github", "GitHubAdapter"),
+    "hackernews": ("hn", "HackerNewsAdapter"),
+    "x_twitter": ("x_twitter", "XTwitterAdapter"),
+    "bootcamps": ("bootcamps", "BootcampAdapter"),
+    "gaming_platforms": ("gaming_platforms", "GamingPlatformAdapter"),
 }
+_LAZY_CLASSES = {cls: module for module, cls in _ADAPTER_MODULES.values()}
+
+
+def _load(module: str, cls: str) -> type[BaseAdapter]:
+    return getattr(import_module(f".{module}", __name__), cls)
+
+
+class _AdapterRegistry(Mapping):
+    """Adapter key -> adapter class, importing each adapter module lazily."""
+
+    def __getitem__(self, key: str) -> type[BaseAdapter]:
+        return _load(*_ADAPTER_MODULES[key])
+
+    def __iter__(self):
+        return iter(_ADAPTER_MODULES)
+
+    def __len__(self):
+        return len(_ADAPTER_MODULES)
+
+    def __contains__(self, key) -> bool:
+        return key in _ADAPTER_MODULES
+
+
+ADAPTERS = _AdapterRegistry()
+
+
+def __getattr__(name: str):
+    if name in _LAZY_CLASSES:
+        value = _load(_LAZY_CLASSES[name], name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def fetch_all(configs: dict) -> dict:
+    """Run the named adapters' fetches concurrently.
+
+    `configs` maps adapter key -> config. Returns adapter key -> list of
+    prospects, or the exception that adapter raised. Unknown keys are skipped.
+    """
+    keys = [key for key in configs if key in ADAPTERS]
+    results = await asyncio.gather(
+        *(_fetch_one(key, configs[key]) for key in keys),
+        return_exceptions=True,
+    )
+    return dict(zip(keys, results))
+
+
+async def fetch_each(configs: dict):
+    """Like fetch_all, but yields (adapter key, prospects or exception) as each
+    adapter finishes instead of returning once the slowest one has."""
+    async def run(key: str) -> tuple:
+        try:
+            return key, await _fetch_one(key, configs[key])
+        except Exception as e:
+            return key, e
+
+    for next_done in asyncio.as_completed([run(key) for key in configs if key in ADAPTERS]):
+        yield await next_done
+
+
+async def _fetch_one(key: str, config: dict) -> list[Prospect]:
+    adapter = ADAPTERS[key]()
+    try:
+        return await adapter.fetch(config)
+    finally:
+        await adapter.close()
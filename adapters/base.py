@@ -1,9 +1,9 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Optional
 import time
 
 
-@dataclass
+@dataclass(slots=True)
 class Prospect:
     source: str
     username: str
@@ -21,7 +21,15 @@ class Prospect:
     fetched_at: float = field(default_factory=time.time)
 
     def to_dict(self):
-        return asdict(self)
+        # Cheaper than asdict(): no fields() introspection or deepcopy. Only the
+        # top-level signals/raw_data containers are copied; nested values are shared.
+        d = {name: getattr(self, name) for name in _PROSPECT_FIELDS}
+        d["signals"] = list(self.signals)
+        d["raw_data"] = dict(self.raw_data)
+        return d
+
+
+_PROSPECT_FIELDS = tuple(f.name for f in fields(Prospect))
 
 
 class BaseAdapter:
@@ -35,3 +43,7 @@ class BaseAdapter:
 
     def get_config_schema(self) -> dict:
         return {}
+
+    async def close(self):
+        """Release any network resources held by the adapter."""
+        pass
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import random
+import time
+
+import httpx
+
+# Rate limit resets closer than this are waited out; later ones stop requests
+# until the reset. Covers GitHub's short secondary-limit windows without
+# stalling a run for minutes.
+MAX_RATE_LIMIT_WAIT = 30
+# Rate-limited retries sleep for the reset, or back off exponentially (with
+# jitter) from this many seconds when GitHub gives no reset time
+GITHUB_BACKOFF_BASE = 1.0
+
+# One pooled client for every network adapter, so TCP/TLS connections are kept
+# alive across queries, adapters and pipeline runs instead of redone per fetch.
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared client; called on app shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def github_headers() -> dict:
+    """Headers for GitHub API calls, authenticated when GITHUB_TOKEN is set."""
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    token = os.environ.get("GITHUB_TOKEN", "")
+    if token:
+        # Authenticated requests get 5000/hr instead of the anonymous 60/hr
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def rate_limit_wait(resp: httpx.Response) -> float | None:
+    """Seconds until GitHub accepts requests again, or None if not rate limited."""
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        reset = resp.headers.get("X-RateLimit-Reset", "")
+        return max(0.0, int(reset) - time.time()) if reset.isdigit() else float("inf")
+    if resp.status_code in (403, 429):
+        return float("inf")
+    return None
+
+
+class GitHubRateLimit:
+    """Rate-limit state shared by a group of GitHub requests, so once one of
+    them hits a long limit the rest stop instead of each collecting a 403."""
+
+    def __init__(self):
+        self.until = 0.0
+
+    @property
+    def hit(self) -> bool:
+        """Whether a limit has been hit at all."""
+        return self.until > 0
+
+    @property
+    def exhausted(self) -> bool:
+        return time.time() < self.until
+
+    def exhaust(self, wait: float):
+        self.until = max(self.until, time.time() + wait)
+
+
+async def github_request(client: httpx.AsyncClient, method: str, url: str, limit: GitHubRateLimit,
+                         retries: int = 1, bucket=None, **kwargs) -> httpx.Response | None:
+    """Send a GitHub request, honoring its rate-limit headers.
+
+    A rate-limited request is retried up to `retries` times while the wait is
+    within MAX_RATE_LIMIT_WAIT; a longer one exhausts `limit` until the reset.
+    Returns None while `limit` is exhausted. `bucket`, if given, paces the
+    request (acquire() -> bool) and is synced (sync(remaining)) from the
+    response's X-RateLimit-Remaining, so only pass one for the quota that
+    header reports on.
+    """
+    for attempt in range(retries + 1):
+        if limit.exhausted:
+            return None
+        if bucket is not None and not await bucket.acquire():
+            return None
+        resp = await client.request(method, url, **kwargs)
+        if bucket is not None:
+            bucket.sync(resp.headers.get("X-RateLimit-Remaining"))
+        wait = rate_limit_wait(resp)
+        if wait is None:
+            return resp
+        if resp.status_code not in (403, 429):
+            # Quota just ran out: this response is fine but the next request won't be
+            if wait > MAX_RATE_LIMIT_WAIT:
+                limit.exhaust(wait)
+            return resp
+        if wait == float("inf"):
+            # No reset time given (e.g. a secondary limit): rely on our own backoff
+            wait = 0.0
+        delay = max(wait, GITHUB_BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 1)
+        if delay > MAX_RATE_LIMIT_WAIT or attempt == retries:
+            limit.exhaust(delay)
+            return None
+        await asyncio.sleep(delay)
+    return None
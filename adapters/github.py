@@ -1,6 +1,12 @@
+import asyncio
 import httpx
-from datetime import datetime, timedelta
+import orjson
+import os
+import time
+from datetime import datetime, timedelta, timezone
 from .base import BaseAdapter, Prospect
+from . import http_cache
+from .client import GitHubRateLimit, get_client, github_headers, github_request
 
 
 GAMING_QUERIES = [
@@ -15,6 +21,139 @@ GAMING_QUERIES = [
     "indie game dev",
 ]
 
+DEFAULT_QUERIES = [
+    "open to work",
+    "looking for work developer",
+    "bootcamp graduate",
+    "career change software",
+    "self-taught developer",
+]
+
+# Shared by get_config_schema() and fetch() instead of being rebuilt per call
+_CONFIG_SCHEMA = {
+    "queries": {
+        "type": "list",
+        "label": "Search queries",
+        "default": DEFAULT_QUERIES,
+    },
+    "max_results_per_query": {
+        "type": "number",
+        "label": "Max results per query",
+        "default": 20,
+    },
+    "recency_months": {
+        "type": "number",
+        "label": "Only users created/updated in last N months",
+        "default": 6,
+    },
+}
+
+# Bio keyword -> signal, precompiled so the per-user scan does no string formatting
+_JOB_BIO_SIGNALS = tuple(
+    (kw, f"bio_mentions_{kw.replace(' ', '_')}")
+    for kw in ["looking for", "open to", "seeking", "available", "hire me", "freelance"]
+)
+_BACKGROUND_BIO_SIGNALS = tuple(
+    (kw, kw.replace("-", "_").replace("#", ""))
+    for kw in ["self-taught", "bootcamp", "career change", "100daysofcode", "#buildinpublic"]
+)
+_GAMING_BIO_SIGNALS = tuple(
+    (kw, f"gaming_interest_{kw.replace(' ', '_')}")
+    for kw in ["game", "arcade", "retro", "pixel", "phaser", "gamedev", "game jam", "game dev",
+               "streamer", "youtuber", "youtube", "twitch", "reviewer", "gaming"]
+)
+
+_BIO_SIGNALS = {
+    "memex": _JOB_BIO_SIGNALS + _BACKGROUND_BIO_SIGNALS,
+    "openarcade": _JOB_BIO_SIGNALS + _BACKGROUND_BIO_SIGNALS + _GAMING_BIO_SIGNALS,
+}
+
+# (signal, query keyword, category), checked in order; the first rule whose
+# signal the prospect has, or whose keyword is in the matched query, wins.
+# The bootcamp and 100daysofcode signals come straight from the bio scan.
+_MEMEX_CATEGORY_RULES = (
+    ("bootcamp", "bootcamp", "Bootcamp Graduate"),
+    ("self_taught", "self-taught", "Self-Taught Developer"),
+    ("career_change", "career change", "Career Changer"),
+    ("100daysofcode", None, "100DaysOfCode"),
+    ("buildinpublic", None, "Build in Public"),
+    ("hireable_flag", None, "Job Seeker"),
+)
+
+# Checked in order; the first rule whose signals overlap the prospect's wins
+_GAMING_CATEGORY_RULES = (
+    (frozenset({"gaming_interest_youtuber", "gaming_interest_youtube"}), "Gaming YouTuber"),
+    (frozenset({"gaming_interest_streamer", "gaming_interest_twitch"}), "Retro Gaming Streamer"),
+    (frozenset({"gaming_interest_reviewer"}), "Game Reviewer"),
+    (frozenset({"gaming_interest_retro", "gaming_interest_arcade"}), "Retro Enthusiast"),
+)
+
+# Stay well under GitHub's secondary rate limit on concurrent requests
+MAX_CONCURRENT_PROFILE_FETCHES = 10
+
+# Cached profiles younger than this are used without contacting GitHub at all
+PROFILE_CACHE_TTL = 3600
+
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+_GRAPHQL_USER_SEARCH = """
+query($q: String!, $first: Int!) {
+  search(query: $q, type: USER, first: $first) {
+    nodes {
+      ... on User {
+        login name bio company location isHireable createdAt updatedAt url
+        followers { totalCount }
+        following { totalCount }
+        repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+      }
+    }
+  }
+}
+"""
+
+
+def _graphql_node_to_profile(node: dict) -> dict:
+    """Reshape a GraphQL User node into the REST /users/{login} fields we read."""
+    return {
+        "login": node["login"],
+        "name": node.get("name"),
+        "bio": node.get("bio"),
+        "company": node.get("company"),
+        "location": node.get("location"),
+        "hireable": node.get("isHireable"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "html_url": node.get("url") or f"https://github.com/{node['login']}",
+        "public_repos": (node.get("repositories") or {}).get("totalCount", 0),
+        "followers": (node.get("followers") or {}).get("totalCount", 0),
+        "following": (node.get("following") or {}).get("totalCount", 0),
+    }
+
+
+def _dedupe_queries(queries: list) -> list:
+    """Drop queries that only differ by case or whitespace; they'd return the same users."""
+    seen = set()
+    unique = []
+    for query in queries:
+        key = " ".join(query.lower().split())
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(query)
+    return unique
+
+
+async def _gather_queries(searches) -> list:
+    """Gather per-query searches so one failing query doesn't discard the others.
+
+    A failed query contributes an empty batch; if every query failed, the
+    first error is raised so a real outage still reaches the pipeline.
+    """
+    results = await asyncio.gather(*searches, return_exceptions=True)
+    if results and all(isinstance(r, BaseException) for r in results):
+        raise results[0]
+    return [[] if isinstance(r, BaseException) else r for r in results]
+
 
 class GitHubAdapter(BaseAdapter):
     name = "github"
@@ -23,168 +162,240 @@ class GitHubAdapter(BaseAdapter):
     categories = ["Developer Communities", "Open Source", "Job Seekers"]
 
     def get_config_schema(self):
-        return {
-            "queries": {
-                "type": "list",
-                "label": "Search queries",
-                "default": [
-                    "open to work",
-                    "looking for work developer",
-                    "bootcamp graduate",
-                    "career change software",
-                    "self-taught developer",
-                ],
-            },
-            "max_results_per_query": {
-                "type": "number",
-                "label": "Max results per query",
-                "default": 20,
-            },
-            "recency_months": {
-                "type": "number",
-                "label": "Only users created/updated in last N months",
-                "default": 6,
-            },
-        }
+        return _CONFIG_SCHEMA
 
     async def fetch(self, config: dict) -> list[Prospect]:
         campaign = config.get("campaign", "memex")
-        default_queries = GAMING_QUERIES if campaign == "openarcade" else self.get_config_schema()["queries"]["default"]
-        queries = config.get("queries", default_queries)
+        default_queries = GAMING_QUERIES if campaign == "openarcade" else DEFAULT_QUERIES
+        queries = _dedupe_queries(config.get("queries", default_queries))
         max_per = config.get("max_results_per_query", 20)
         recency = config.get("recency_months", 6)
+        rate_limited = GitHubRateLimit()
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=recency * 30)
+
+        client = get_client()
+        if os.environ.get("GITHUB_TOKEN"):
+            prospects = await self._fetch_graphql(client, queries, max_per, cutoff, campaign, rate_limited)
+        else:
+            prospects = await self._fetch_rest(client, queries, max_per, cutoff, campaign, rate_limited)
+
+        if rate_limited.hit and not prospects:
+            # Surface it as an adapter error rather than an unexplained empty result
+            raise RuntimeError("GitHub API rate limit reached; try again later")
+        return prospects
+
+    async def _fetch_rest(self, client: httpx.AsyncClient, queries: list, max_per: int,
+                          cutoff: datetime, campaign: str, rate_limited: GitHubRateLimit) -> list[Prospect]:
+        """Run every bio search, then fetch each distinct matching profile once."""
+        searches = await _gather_queries(
+            self._search_query(client, query, max_per, cutoff, rate_limited) for query in queries
+        )
+
+        # Merged in query order, so a user matched by several queries is fetched
+        # once and credited to the first. GitHub logins are case-insensitive.
+        matches = {}
+        for query, logins in zip(queries, searches):
+            for login in logins:
+                matches.setdefault(login.lower(), (login, query))
+
+        # One gather for the whole detail phase; a profile that times out only
+        # costs that one user
+        sem = asyncio.Semaphore(MAX_CONCURRENT_PROFILE_FETCHES)
+        profiles = await asyncio.gather(*(
+            self._fetch_profile(client, sem, login, rate_limited) for login, _ in matches.values()
+        ), return_exceptions=True)
+
         prospects = []
-        seen = set()
-
-        cutoff = (datetime.now() - timedelta(days=recency * 30)).strftime("%Y-%m-%d")
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            for query in queries:
-                try:
-                    # Search users by bio, sorted by most recently joined, filtered by recency
-                    resp = await client.get(
-                        "https://api.github.com/search/users",
-                        params={
-                            "q": f"{query} in:bio created:>{cutoff}",
-                            "sort": "joined",
-                            "order": "desc",
-                            "per_page": min(max_per, 30),
-                        },
-                        headers={"Accept": "application/vnd.github.v3+json"},
-                    )
-                    if resp.status_code == 403:
-                        break  # Rate limited
-                    if resp.status_code != 200:
-                        continue
-
-                    data = resp.json()
-                    for user in data.get("items", []):
-                        login = user["login"]
-                        if login in seen:
-                            continue
-                        seen.add(login)
-
-                        user_resp = await client.get(
-                            f"https://api.github.com/users/{login}",
-                            headers={"Accept": "application/vnd.github.v3+json"},
-                        )
-                        if user_resp.status_code == 403:
-                            break  # Rate limited
-                        if user_resp.status_code != 200:
-                            continue
-                        profile = user_resp.json()
-
-                        # Skip users who haven't been active recently
-                        updated = profile.get("updated_at", "")
-                        if updated and updated[:10] < cutoff:
-                            continue
-
-                        signals = []
-                        bio = profile.get("bio") or ""
-
-                        if profile.get("public_repos", 0) > 0 and profile.get("public_repos", 0) < 10:
-                            signals.append("few_public_repos")
-                        if not profile.get("company"):
-                            signals.append("no_company")
-                        if profile.get("hireable"):
-                            signals.append("hireable_flag")
-                        if profile.get("followers", 0) < 50:
-                            signals.append("low_followers")
-
-                        bio_lower = bio.lower()
-                        for kw in ["looking for", "open to", "seeking", "available", "hire me", "freelance"]:
-                            if kw in bio_lower:
-                                signals.append(f"bio_mentions_{kw.replace(' ', '_')}")
-                        for kw in ["self-taught", "bootcamp", "career change", "100daysofcode", "#buildinpublic"]:
-                            if kw in bio_lower:
-                                signals.append(kw.replace("-", "_").replace("#", ""))
-
-                        # Gaming-specific signals
-                        if campaign == "openarcade":
-                            for kw in ["game", "arcade", "retro", "pixel", "phaser", "gamedev", "game jam", "game dev",
-                                        "streamer", "youtuber", "youtube", "twitch", "reviewer", "gaming"]:
-                                if kw in bio_lower:
-                                    signals.append(f"gaming_interest_{kw.replace(' ', '_')}")
-                            # Check repos for game-related content
-                            if profile.get("public_repos", 0) > 0:
-                                signals.append("has_game_repos")
-
-                        prospects.append(Prospect(
-                            source="github",
-                            username=login,
-                            display_name=profile.get("name") or login,
-                            profile_url=profile["html_url"],
-                            bio=bio,
-                            category=self._categorize(bio, signals, query, campaign),
-                            signals=signals,
-                            raw_data={
-                                "public_repos": profile.get("public_repos", 0),
-                                "followers": profile.get("followers", 0),
-                                "following": profile.get("following", 0),
-                                "company": profile.get("company"),
-                                "location": profile.get("location"),
-                                "hireable": profile.get("hireable"),
-                                "created_at": profile.get("created_at"),
-                                "updated_at": profile.get("updated_at"),
-                                "query_matched": query,
-                            },
-                        ))
-
-                except httpx.TimeoutException:
-                    continue
+        for (_, query), profile in zip(matches.values(), profiles):
+            if isinstance(profile, httpx.TimeoutException):
+                continue
+            if isinstance(profile, BaseException):
+                raise profile
+            if profile is not None:
+                prospect = self._to_prospect(profile, query, cutoff, campaign)
+                if prospect is not None:
+                    prospects.append(prospect)
+        return prospects
+
+    async def _fetch_graphql(self, client: httpx.AsyncClient, queries: list, max_per: int,
+                             cutoff: datetime, campaign: str, rate_limited: GitHubRateLimit) -> list[Prospect]:
+        """Run every bio search through GraphQL; the profiles come back inline."""
+        searches = await _gather_queries(
+            self._search_query_graphql(client, query, max_per, cutoff, rate_limited) for query in queries
+        )
 
+        # Merged in query order as in _fetch_rest, whichever search finished first
+        matches = {}
+        for query, nodes in zip(queries, searches):
+            for node in nodes:
+                matches.setdefault(node["login"].lower(), (node, query))
+
+        prospects = []
+        for node, query in matches.values():
+            prospect = self._to_prospect(_graphql_node_to_profile(node), query, cutoff, campaign)
+            if prospect is not None:
+                prospects.append(prospect)
         return prospects
 
-    def _categorize(self, bio: str, signals: list, query: str, campaign: str = "memex") -> str:
+    async def _search_query(self, client: httpx.AsyncClient, query: str, max_per: int,
+                            cutoff: datetime, rate_limited: GitHubRateLimit) -> list[str]:
+        """Run one bio search and return the matching logins."""
+        try:
+            # Search users by bio, sorted by most recently joined, filtered by recency.
+            # type:user keeps organizations out server-side, saving a profile GET each.
+            resp = await github_request(
+                client, "GET", "https://api.github.com/search/users", rate_limited,
+                params={
+                    "q": f"{query} in:bio type:user created:>{cutoff.date().isoformat()}",
+                    "sort": "joined",
+                    "order": "desc",
+                    "per_page": min(max_per, 30),
+                },
+                headers=github_headers(),
+            )
+        except httpx.TimeoutException:
+            return []
+        if resp is None or resp.status_code != 200:
+            return []
+        return [user["login"] for user in orjson.loads(resp.content).get("items", [])]
+
+    async def _search_query_graphql(self, client: httpx.AsyncClient, query: str, max_per: int,
+                                    cutoff: datetime, rate_limited: GitHubRateLimit) -> list[dict]:
+        """Run one bio search through GraphQL and return the matching user nodes.
+
+        Replaces the REST search + one /users/{login} GET per result with a
+        single request. GitHub only serves GraphQL to authenticated callers.
+        """
+        try:
+            resp = await github_request(
+                client, "POST", GITHUB_GRAPHQL_URL, rate_limited,
+                json={
+                    "query": _GRAPHQL_USER_SEARCH,
+                    "variables": {
+                        "q": f"{query} in:bio created:>{cutoff.date().isoformat()} sort:joined-desc",
+                        "first": min(max_per, 30),
+                    },
+                },
+                headers=github_headers(),
+            )
+        except httpx.TimeoutException:
+            return []
+        if resp is None or resp.status_code != 200:
+            return []
+
+        payload = orjson.loads(resp.content)
+        if any(e.get("type") == "RATE_LIMITED" for e in payload.get("errors") or []):
+            rate_limited.exhaust(float("inf"))
+            return []
+        search = (payload.get("data") or {}).get("search") or {}
+
+        # Organizations match `type: USER` searches too and come back as empty nodes
+        return [node for node in search.get("nodes") or [] if node and node.get("login")]
+
+    def _to_prospect(self, profile: dict, query: str, cutoff: datetime, campaign: str) -> Prospect | None:
+        """Build a prospect from a REST-shaped user profile, or None if it's stale."""
+        login = profile["login"]
+
+        # Skip users who haven't been active recently
+        updated = profile.get("updated_at")
+        if updated and datetime.fromisoformat(updated.replace("Z", "+00:00")) < cutoff:
+            return None
+
+        signals = []
+        bio = profile.get("bio") or ""
+        repos = profile.get("public_repos", 0)
+        followers = profile.get("followers", 0)
+        company = profile.get("company")
+        hireable = profile.get("hireable")
+
+        if 0 < repos < 10:
+            signals.append("few_public_repos")
+        if not company:
+            signals.append("no_company")
+        if hireable:
+            signals.append("hireable_flag")
+        if followers < 50:
+            signals.append("low_followers")
+
+        # One pass over every keyword group for the campaign (gaming ones included)
         bio_lower = bio.lower()
+        bio_signals = _BIO_SIGNALS.get(campaign, _BIO_SIGNALS["memex"])
+        signals.extend([signal for kw, signal in bio_signals if kw in bio_lower])
+
+        # Check repos for game-related content
+        if campaign == "openarcade" and repos > 0:
+            signals.append("has_game_repos")
+
+        return Prospect(
+            source="github",
+            username=login,
+            display_name=profile.get("name") or login,
+            profile_url=profile["html_url"],
+            bio=bio,
+            category=self._categorize(signals, query, campaign),
+            signals=signals,
+            raw_data={
+                "public_repos": repos,
+                "followers": followers,
+                "following": profile.get("following", 0),
+                "company": company,
+                "location": profile.get("location"),
+                "hireable": hireable,
+                "created_at": profile.get("created_at"),
+                "updated_at": updated,
+                "query_matched": query,
+            },
+        )
+
+    async def _fetch_profile(self, client: httpx.AsyncClient, sem: asyncio.Semaphore, login: str,
+                             rate_limited: GitHubRateLimit) -> dict | None:
+        """GET /users/{login}, bounded by the shared semaphore. Returns None on failure.
+
+        Profiles are cached through adapters.http_cache once the app has
+        configured it. Within PROFILE_CACHE_TTL the cached copy is used as is;
+        after that it's revalidated with If-None-Match / If-Modified-Since, and
+        a 304 doesn't count against GitHub's rate limit.
+        """
+        url = f"https://api.github.com/users/{login}"
+        cached = await http_cache.get(url)
+        if cached and time.time() - (cached["fetched_at"] or 0) < PROFILE_CACHE_TTL:
+            return orjson.loads(cached["body"])
+        headers = github_headers()
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        async with sem:
+            resp = await github_request(client, "GET", url, rate_limited, headers=headers)
+        if resp is None:
+            return None
+        if resp.status_code == 304 and cached:
+            # Unchanged: restart the TTL so the next run skips the request entirely
+            await http_cache.touch(url)
+            return orjson.loads(cached["body"])
+        if resp.status_code != 200:
+            return None
+        await http_cache.save(url, resp.text, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+        return orjson.loads(resp.content)
+
+    def _categorize(self, signals: list, query: str, campaign: str = "memex") -> str:
+        signal_set = set(signals)
+        query_lower = query.lower()
 
         if campaign == "openarcade":
             # Gaming-specific categorization
-            if any(s.startswith("gaming_interest_youtuber") or s.startswith("gaming_interest_youtube") for s in signals):
-                return "Gaming YouTuber"
-            if any(s.startswith("gaming_interest_streamer") or s.startswith("gaming_interest_twitch") for s in signals):
-                return "Retro Gaming Streamer"
-            if any(s.startswith("gaming_interest_reviewer") for s in signals):
-                return "Game Reviewer"
-            if any(s.startswith("gaming_interest_retro") or s.startswith("gaming_interest_arcade") for s in signals):
-                return "Retro Enthusiast"
-            if "game jam" in query.lower() or any(s.startswith("gaming_interest_game_jam") for s in signals):
+            for keys, category in _GAMING_CATEGORY_RULES:
+                if not signal_set.isdisjoint(keys):
+                    return category
+            if "game jam" in query_lower or "gaming_interest_game_jam" in signal_set:
                 return "Game Jam Participant"
-            if any(s.startswith("gaming_interest_") for s in signals):
-                return "Game Developer"
             return "Game Developer"
 
         # Memex categorization (original)
-        if "bootcamp" in bio_lower or "bootcamp" in query.lower():
-            return "Bootcamp Graduate"
-        if "self_taught" in signals or "self-taught" in query.lower():
-            return "Self-Taught Developer"
-        if "career_change" in signals or "career change" in query.lower():
-            return "Career Changer"
-        if "100daysofcode" in bio_lower:
-            return "100DaysOfCode"
-        if "buildinpublic" in signals:
-            return "Build in Public"
-        if "hireable_flag" in signals:
-            return "Job Seeker"
+        for signal, query_kw, category in _MEMEX_CATEGORY_RULES:
+            if signal in signal_set or (query_kw and query_kw in query_lower):
+                return category
         return "Developer"
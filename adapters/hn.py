@@ -1,9 +1,22 @@
+import asyncio
 import httpx
+import orjson
 import re
 from .base import BaseAdapter, Prospect
+from .client import get_client
 
 HN_ALGOLIA = "https://hn.algolia.com/api/v1"
 
+# Compiled once; these run over every story title and comment
+_URL_RE = re.compile(r'https?://[^\s<>"\']+')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Tech keyword -> signal, precompiled so the per-comment scan does no string formatting
+_TECH_SIGNALS = tuple(
+    (tech, f"tech_{tech.strip().replace(' ', '_')}")
+    for tech in ["python", "rust", "go ", "golang", "typescript", "react", "machine learning", "ai ", "llm", "kubernetes", "aws"]
+)
+
 GAMING_SEARCH_QUERIES = [
     "browser game",
     "web games",
@@ -12,6 +25,47 @@ GAMING_SEARCH_QUERIES = [
     "Show HN game",
 ]
 
+# (signal, category), checked in order; the first signal the prospect has wins
+_GAMING_CATEGORY_RULES = (
+    ("show_hn_poster", "Game Developer"),
+    ("gaming_retro", "Retro Enthusiast"),
+    ("gaming_indiedev", "Indie Game Dev"),
+    ("gaming_browser", "Browser Game Enthusiast"),
+)
+_HIRING_CATEGORY_RULES = (
+    ("freelance_available", "Freelancer"),
+    ("junior_level", "Junior Developer"),
+    ("senior_level", "Senior Developer"),
+)
+
+# Built once rather than on every get_config_schema() call
+_CONFIG_SCHEMA = {
+    "thread_type": {
+        "type": "select",
+        "label": "Thread type",
+        "options": ["Who wants to be hired?", "Who is hiring?", "Freelancer? Seeking freelancer?"],
+        "default": "Who wants to be hired?",
+    },
+    "months_back": {
+        "type": "number",
+        "label": "Months to search back",
+        "default": 2,
+    },
+    "max_results": {
+        "type": "number",
+        "label": "Max results per thread",
+        "default": 50,
+    },
+}
+
+
+def _clean_text(text: str) -> str:
+    """Strip HTML tags and collapse runs of whitespace."""
+    # Most titles and many comments have no markup at all
+    if "<" in text:
+        text = _TAG_RE.sub(" ", text)
+    return " ".join(text.split())
+
 
 class HackerNewsAdapter(BaseAdapter):
     name = "hackernews"
@@ -20,24 +74,7 @@ class HackerNewsAdapter(BaseAdapter):
     categories = ["Startup Hiring", "Job Seekers", "Developer Communities"]
 
     def get_config_schema(self):
-        return {
-            "thread_type": {
-                "type": "select",
-                "label": "Thread type",
-                "options": ["Who wants to be hired?", "Who is hiring?", "Freelancer? Seeking freelancer?"],
-                "default": "Who wants to be hired?",
-            },
-            "months_back": {
-                "type": "number",
-                "label": "Months to search back",
-                "default": 2,
-            },
-            "max_results": {
-                "type": "number",
-                "label": "Max results per thread",
-                "default": 50,
-            },
-        }
+        return _CONFIG_SCHEMA
 
     async def fetch(self, config: dict) -> list[Prospect]:
         campaign = config.get("campaign", "memex")
@@ -51,66 +88,72 @@ class HackerNewsAdapter(BaseAdapter):
         prospects = []
         seen = set()
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            for query in GAMING_SEARCH_QUERIES:
-                try:
-                    # Search stories about gaming
-                    resp = await client.get(
-                        f"{HN_ALGOLIA}/search",
-                        params={
-                            "query": query,
-                            "tags": "story",
-                            "hitsPerPage": min(max_results, 20),
-                        },
-                    )
-                    if resp.status_code != 200:
-                        continue
-
-                    stories = resp.json().get("hits", [])
-                    for story in stories:
-                        author = story.get("author") or "unknown"
-                        if author in seen:
-                            continue
-                        seen.add(author)
-
-                        title = story.get("title") or ""
-                        url = story.get("url") or ""
-                        text_lower = f"{title} {url}".lower()
-
-                        signals = ["active_in_gaming"]
-                        if "show hn" in title.lower():
-                            signals.append("show_hn_poster")
-                        if any(kw in text_lower for kw in ["browser", "web", "html5", "javascript"]):
-                            signals.append("gaming_browser")
-                        if any(kw in text_lower for kw in ["retro", "arcade", "classic"]):
-                            signals.append("gaming_retro")
-                        if any(kw in text_lower for kw in ["indie", "jam"]):
-                            signals.append("gaming_indiedev")
-                        if story.get("points", 0) > 50:
-                            signals.append("high_engagement_post")
-
-                        clean_bio = re.sub(r'<[^>]+>', ' ', title)
-                        clean_bio = re.sub(r'\s+', ' ', clean_bio).strip()
-
-                        prospects.append(Prospect(
-                            source="hackernews",
-                            username=author,
-                            display_name=author,
-                            profile_url=f"https://news.ycombinator.com/user?id={author}",
-                            bio=clean_bio,
-                            category=self._categorize_gaming(text_lower, signals),
-                            signals=signals,
-                            raw_data={
-                                "story_title": title,
-                                "story_url": url,
-                                "story_id": story.get("objectID"),
-                                "points": story.get("points", 0),
-                                "query_matched": query,
-                                "created_at": story.get("created_at"),
-                            },
-                        ))
-                except httpx.TimeoutException:
+        client = get_client()
+        # All queries go out at once; results are still walked in query order so
+        # the first query to surface an author keeps it
+        responses = await asyncio.gather(*(
+            client.get(
+                f"{HN_ALGOLIA}/search",
+                params={
+                    "query": query,
+                    "tags": "story",
+                    "hitsPerPage": min(max_results, 20),
+                },
+            )
+            for query in GAMING_SEARCH_QUERIES
+        ), return_exceptions=True)
+
+        for query, resp in zip(GAMING_SEARCH_QUERIES, responses):
+            # Network failures (timeouts included) only cost that search
+            if isinstance(resp, httpx.TransportError):
+                continue
+            if isinstance(resp, BaseException):
+                raise resp
+            if resp.status_code != 200:
+                continue
+
+            stories = orjson.loads(resp.content).get("hits", [])
+            for story in stories:
+                author = story.get("author") or "unknown"
+                if author in seen:
                     continue
+                seen.add(author)
+
+                title = story.get("title") or ""
+                url = story.get("url") or ""
+                text_lower = f"{title} {url}".lower()
+
+                signals = ["active_in_gaming"]
+                if "show hn" in title.lower():
+                    signals.append("show_hn_poster")
+                if any(kw in text_lower for kw in ["browser", "web", "html5", "javascript"]):
+                    signals.append("gaming_browser")
+                if any(kw in text_lower for kw in ["retro", "arcade", "classic"]):
+                    signals.append("gaming_retro")
+                if any(kw in text_lower for kw in ["indie", "jam"]):
+                    signals.append("gaming_indiedev")
+                if story.get("points", 0) > 50:
+                    signals.append("high_engagement_post")
+
+                clean_bio = _clean_text(title)
+
+                prospects.append(Prospect(
+                    source="hackernews",
+                    username=author,
+                    display_name=author,
+                    profile_url=f"https://news.ycombinator.com/user?id={author}",
+                    bio=clean_bio,
+                    category=self._categorize_gaming(text_lower, signals),
+                    signals=signals,
+                    raw_data={
+                        "story_title": title,
+                        "story_url": url,
+                        "story_id": story.get("objectID"),
+                        "points": story.get("points", 0),
+                        "query_matched": query,
+                        "created_at": story.get("created_at"),
+                    },
+                ))
 
         return prospects
 
@@ -121,123 +164,129 @@ class HackerNewsAdapter(BaseAdapter):
         max_results = config.get("max_results", 50)
         prospects = []
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            thread_keyword = thread_type.split("?")[0].strip()
-            resp = await client.get(
-                f"{HN_ALGOLIA}/search_by_date",
-                params={
-                    "tags": "ask_hn,author_whoishiring",
-                    "hitsPerPage": 20,
-                },
-            )
-            if resp.status_code != 200:
-                return prospects
-
-            all_threads = resp.json().get("hits", [])
-            matching = [t for t in all_threads if thread_keyword.lower() in (t.get("title") or "").lower()]
-            threads = matching[:months_back]
+        client = get_client()
+        thread_keyword = thread_type.split("?")[0].strip()
+        resp = await client.get(
+            f"{HN_ALGOLIA}/search_by_date",
+            params={
+                "tags": "ask_hn,author_whoishiring",
+                "hitsPerPage": 20,
+            },
+        )
+        if resp.status_code != 200:
+            return prospects
 
-            if not threads:
-                return prospects
+        all_threads = orjson.loads(resp.content).get("hits", [])
+        matching = [t for t in all_threads if thread_keyword.lower() in (t.get("title") or "").lower()]
+        threads = [t for t in matching[:months_back] if t.get("objectID")]
 
-            for thread in threads:
-                story_id = thread.get("objectID")
-                thread_title = thread.get("title", "")
-                if not story_id:
-                    continue
+        if not threads:
+            return prospects
 
-                comment_resp = await client.get(
-                    f"{HN_ALGOLIA}/search",
-                    params={
-                        "tags": f"comment,story_{story_id}",
-                        "hitsPerPage": max_results,
+        # Fetch every thread's comments at once rather than one month at a time
+        comment_responses = await asyncio.gather(*(
+            client.get(
+                f"{HN_ALGOLIA}/search",
+                params={
+                    "tags": f"comment,story_{thread['objectID']}",
+                    "hitsPerPage": max_results,
+                },
+            )
+            for thread in threads
+        ), return_exceptions=True)
+
+        # Network failures (timeouts included) only cost that thread, as in
+        # _fetch_gaming; anything else is a real error and is raised
+        for thread, comment_resp in zip(threads, comment_responses):
+            thread_title = thread.get("title", "")
+            if isinstance(comment_resp, httpx.TransportError):
+                continue
+            if isinstance(comment_resp, BaseException):
+                raise comment_resp
+            if comment_resp.status_code != 200:
+                continue
+
+            comments = orjson.loads(comment_resp.content).get("hits", [])
+
+            # Drop one-liners ("+1", "following") before any per-comment work
+            candidates = [
+                (comment, text)
+                for comment in comments
+                if len(text := comment.get("comment_text") or "") >= 50
+            ]
+
+            for comment, text in candidates:
+                author = comment.get("author") or "unknown"
+
+                signals = []
+                text_lower = text.lower()
+
+                if "remote" in text_lower:
+                    signals.append("wants_remote")
+                if "freelance" in text_lower or "contract" in text_lower:
+                    signals.append("freelance_available")
+                if "full-stack" in text_lower or "fullstack" in text_lower:
+                    signals.append("fullstack")
+                if "senior" in text_lower or "staff" in text_lower or "principal" in text_lower:
+                    signals.append("senior_level")
+                if "junior" in text_lower or "entry" in text_lower or "new grad" in text_lower:
+                    signals.append("junior_level")
+                signals.extend([signal for tech, signal in _TECH_SIGNALS if tech in text_lower])
+
+                # First link of each kind, in one pass over the comment's URLs
+                github_url = linkedin_url = website_url = None
+                for u in _URL_RE.findall(text):
+                    if "github.com" in u:
+                        github_url = github_url or u
+                    elif "linkedin.com" in u:
+                        linkedin_url = linkedin_url or u
+                    elif website_url is None:
+                        website_url = u
+                    if github_url and linkedin_url and website_url:
+                        break
+
+                if github_url:
+                    signals.append("has_github")
+                if linkedin_url:
+                    signals.append("has_linkedin")
+                if website_url:
+                    signals.append("has_website")
+
+                clean_bio = _clean_text(text)
+                if len(clean_bio) > 500:
+                    clean_bio = clean_bio[:500] + "..."
+
+                prospects.append(Prospect(
+                    source="hackernews",
+                    username=author,
+                    display_name=author,
+                    profile_url=f"https://news.ycombinator.com/user?id={author}",
+                    bio=clean_bio,
+                    category=self._categorize(text_lower, signals, thread_type),
+                    signals=signals,
+                    raw_data={
+                        "thread_title": thread_title,
+                        "comment_id": comment.get("objectID"),
+                        "github_url": github_url,
+                        "linkedin_url": linkedin_url,
+                        "website_url": website_url,
+                        "thread_type": thread_type,
+                        "created_at": comment.get("created_at"),
                     },
-                )
-                if comment_resp.status_code != 200:
-                    continue
-
-                comments = comment_resp.json().get("hits", [])
-
-                for comment in comments:
-                    text = comment.get("comment_text") or ""
-                    author = comment.get("author") or "unknown"
-
-                    if len(text) < 50:
-                        continue
-
-                    signals = []
-                    text_lower = text.lower()
-
-                    if "remote" in text_lower:
-                        signals.append("wants_remote")
-                    if "freelance" in text_lower or "contract" in text_lower:
-                        signals.append("freelance_available")
-                    if "full-stack" in text_lower or "fullstack" in text_lower:
-                        signals.append("fullstack")
-                    if "senior" in text_lower or "staff" in text_lower or "principal" in text_lower:
-                        signals.append("senior_level")
-                    if "junior" in text_lower or "entry" in text_lower or "new grad" in text_lower:
-                        signals.append("junior_level")
-                    for tech in ["python", "rust", "go ", "golang", "typescript", "react", "machine learning", "ai ", "llm", "kubernetes", "aws"]:
-                        if tech in text_lower:
-                            signals.append(f"tech_{tech.strip().replace(' ', '_')}")
-
-                    urls = re.findall(r'https?://[^\s<>"\']+', text)
-                    github_url = next((u for u in urls if "github.com" in u), None)
-                    linkedin_url = next((u for u in urls if "linkedin.com" in u), None)
-                    website_url = next((u for u in urls if "github.com" not in u and "linkedin.com" not in u), None)
-
-                    if github_url:
-                        signals.append("has_github")
-                    if linkedin_url:
-                        signals.append("has_linkedin")
-                    if website_url:
-                        signals.append("has_website")
-
-                    clean_bio = re.sub(r'<[^>]+>', ' ', text)
-                    clean_bio = re.sub(r'\s+', ' ', clean_bio).strip()
-                    if len(clean_bio) > 500:
-                        clean_bio = clean_bio[:500] + "..."
-
-                    prospects.append(Prospect(
-                        source="hackernews",
-                        username=author,
-                        display_name=author,
-                        profile_url=f"https://news.ycombinator.com/user?id={author}",
-                        bio=clean_bio,
-                        category=self._categorize(text_lower, signals, thread_type),
-                        signals=signals,
-                        raw_data={
-                            "thread_title": thread_title,
-                            "comment_id": comment.get("objectID"),
-                            "github_url": github_url,
-                            "linkedin_url": linkedin_url,
-                            "website_url": website_url,
-                            "thread_type": thread_type,
-                            "created_at": comment.get("created_at"),
-                        },
-                    ))
+                ))
 
         return prospects
 
     def _categorize_gaming(self, text: str, signals: list) -> str:
-        if "show_hn_poster" in signals:
-            return "Game Developer"
-        if "gaming_retro" in signals:
-            return "Retro Enthusiast"
-        if "gaming_indiedev" in signals:
-            return "Indie Game Dev"
-        if "gaming_browser" in signals:
-            return "Browser Game Enthusiast"
+        for signal, category in _GAMING_CATEGORY_RULES:
+            if signal in signals:
+                return category
         return "Game Developer"
 
     def _categorize(self, text: str, signals: list, thread_type: str) -> str:
         if "Who is hiring" in thread_type:
             return "Startup Hiring"
-        if "freelance_available" in signals:
-            return "Freelancer"
-        if "junior_level" in signals:
-            return "Junior Developer"
-        if "senior_level" in signals:
-            return "Senior Developer"
+        for signal, category in _HIRING_CATEGORY_RULES:
+            if signal in signals:
+                return category
         return "Job Seeker"
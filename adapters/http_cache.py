@@ -0,0 +1,34 @@
+# Conditional-request cache for adapters: response bodies plus their ETag /
+# Last-Modified validators, kept between runs. The adapter layer doesn't own any
+# storage; the app installs a backend at startup (server.py passes its db
+# module), and until one is installed nothing is cached and every request goes out.
+_backend = None
+
+
+def configure(backend):
+    """Install the cache backend, or None to disable caching.
+
+    The backend provides async get_http_cache(url) -> dict | None (with body,
+    etag, last_modified and fetched_at), save_http_cache(url, body, etag,
+    last_modified) and touch_http_cache(url).
+    """
+    global _backend
+    _backend = backend
+
+
+async def get(url: str) -> dict | None:
+    """The cached entry for url, or None if there isn't one."""
+    if _backend is None:
+        return None
+    return await _backend.get_http_cache(url)
+
+
+async def save(url: str, body: str, etag: str = None, last_modified: str = None):
+    if _backend is not None:
+        await _backend.save_http_cache(url, body, etag, last_modified)
+
+
+async def touch(url: str):
+    """Mark url's entry as just fetched (after a 304), restarting its TTL."""
+    if _backend is not None:
+        await _backend.touch_http_cache(url)
@@ -1,6 +1,11 @@
+import asyncio
 import httpx
+import orjson
 import os
+import time
+from dataclasses import replace
 from .base import BaseAdapter, Prospect
+from .client import get_client
 
 
 GAMING_QUERIES_X = [
@@ -11,6 +16,193 @@ GAMING_QUERIES_X = [
     "#screenshotsaturday arcade",
 ]
 
+# Cap on in-flight searches so a long custom query list doesn't burst the X API
+MAX_CONCURRENT_SEARCHES = 5
+
+# Recent search rejects query strings longer than this (Basic tier)
+MAX_QUERY_LENGTH = 512
+_QUERY_SUFFIX = " -is:retweet lang:en"
+
+# Shared read-only stand-in for missing objects in API payloads
+_EMPTY: dict = {}
+
+SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+# Field selection sent with every search; only query/max_results vary
+_SEARCH_FIELDS = {
+    "tweet.fields": "author_id,created_at,public_metrics",
+    "expansions": "author_id",
+    "user.fields": "name,username,description,public_metrics,profile_image_url",
+}
+
+DEFAULT_QUERIES_X = [
+    "#OpenToWork developer",
+    "#buildinpublic",
+    "laid off software engineer looking",
+    "self-taught developer portfolio",
+    "prompt engineer seeking",
+]
+
+# Shared by get_config_schema() and _live_fetch() instead of being rebuilt per call
+_CONFIG_SCHEMA = {
+    "queries": {
+        "type": "list",
+        "label": "Search queries",
+        "default": DEFAULT_QUERIES_X,
+    },
+    "max_results_per_query": {
+        "type": "number",
+        "label": "Max results per query",
+        "default": 20,
+    },
+    "bearer_token": {
+        "type": "password",
+        "label": "X API Bearer Token (optional - uses mock data if empty)",
+        "default": "",
+    },
+}
+
+
+# Keyword -> signal over bio + tweet, precompiled so each scan is one flat pass
+# with no per-call list building or string formatting. Tech signals go last.
+_TEXT_SIGNALS = (
+    ("open to", "bio_mentions_open_to"),
+    ("looking for", "bio_mentions_looking_for"),
+    ("seeking", "bio_mentions_seeking"),
+    ("available", "bio_mentions_available"),
+    ("laid off", "bio_mentions_laid_off"),
+    ("freelance", "freelance_available"),
+    ("self-taught", "self_taught"),
+    ("bootcamp", "bootcamp_grad"),
+    ("career change", "career_changer"),
+    ("#buildinpublic", "build_in_public"),
+    ("#100daysofcode", "100_days_of_code"),
+    ("remote", "wants_remote"),
+    ("senior", "senior_level"),
+    ("junior", "junior_level"),
+) + tuple(
+    (tech, f"tech_{tech.strip().replace(' ', '_')}")
+    for tech in ["python", "rust", "go ", "typescript", "react", "machine learning", "ai ", "llm", "solidity"]
+)
+
+
+# Mock profiles served when no bearer token is configured:
+# (username, name, bio, query, signals)
+_MOCK_ROWS = [
+    ("sarahcodes_", "Sarah Chen", "Self-taught dev | Day 87 of #100DaysOfCode | Building a habit tracker in React | Previously in marketing | Open to junior roles", "#OpenToWork developer",
+     ["bio_mentions_open_to", "self_taught", "career_changer", "tech_react"]),
+    ("rustacean_mike", "Mike Okonkwo", "Rust + WebAssembly | Ex-FAANG, laid off Jan 2026 | Building CLI tools in public | DMs open for collab", "laid off software engineer looking",
+     ["bio_mentions_laid_off", "senior_level", "tech_rust", "build_in_public"]),
+    ("promptcraft_ai", "Jess Rivera", "Prompt engineer & AI workflow designer | I make LLMs do things they shouldn't be able to | Freelance available", "prompt engineer seeking",
+     ["freelance_available", "ai_prompt_engineer", "bio_mentions_available"]),
+    ("fullstack_nomad", "Alex Petrov", "Digital nomad | Full-stack TS/React/Node | Building SaaS products from Lisbon | #buildinpublic | Portfolio: alexdev.io", "#buildinpublic",
+     ["fullstack", "digital_nomad", "build_in_public", "has_website", "tech_typescript"]),
+    ("boot2code", "Priya Sharma", "Flatiron grad '25 | Python + Django | Looking for my first role | Love pair programming | She/her", "#OpenToWork developer",
+     ["bootcamp_grad", "junior_level", "bio_mentions_looking_for", "tech_python"]),
+    ("ml_marcus", "Marcus Johnson", "ML Engineer | PyTorch + Transformers | Fine-tuning LLMs on weekends | Open to contract work | ex-research at university lab", "prompt engineer seeking",
+     ["tech_machine_learning", "freelance_available", "senior_level"]),
+    ("designdev_kate", "Kate Nakamura", "Design engineer → Full-stack dev | Career changer | Building in Svelte + Go | #100DaysOfCode Day 45", "#buildinpublic",
+     ["career_changer", "self_taught", "tech_go", "build_in_public"]),
+    ("indie_hacker_tom", "Tom Blackwood", "Indie hacker | 3 shipped products, 0 that make money yet | Currently building an AI writing tool | #buildinpublic", "#buildinpublic",
+     ["build_in_public", "indie_hacker", "tech_ai", "has_shipped_products"]),
+    ("dao_contrib_sam", "Sam Osei", "DAO contributor | Solidity + React | Built governance tools for 3 DAOs | Seeking full-time web3 role", "#OpenToWork developer",
+     ["tech_solidity", "web3", "bio_mentions_seeking", "has_portfolio"]),
+    ("junior_jana", "Jana Mueller", "CS student → self-taught web dev | Left academia for tech | Building React apps | Looking for internship/junior role in Berlin", "#OpenToWork developer",
+     ["junior_level", "career_changer", "tech_react", "bio_mentions_looking_for"]),
+    ("devops_diana", "Diana Reyes", "SRE/DevOps | AWS + Terraform + K8s | Just got laid off from Series B startup | 8 years exp | Open to remote", "laid off software engineer looking",
+     ["senior_level", "bio_mentions_laid_off", "tech_devops", "wants_remote"]),
+    ("ai_artisan", "Kai Thompson", "AI image generation + workflow automation | Building custom Stable Diffusion pipelines | Freelance open", "prompt engineer seeking",
+     ["ai_prompt_engineer", "freelance_available", "tech_ai"]),
+    ("react_queen", "Aisha Williams", "React/Next.js specialist | 5 years frontend | Contributor to Radix UI | Exploring new opportunities post-layoff", "laid off software engineer looking",
+     ["senior_level", "bio_mentions_laid_off", "tech_react", "open_source_contributor"]),
+    ("data_dave", "Dave Kowalski", "Data engineer | Spark + dbt + Snowflake | Ex-fintech | Building a personal data stack in public | Available Q1 2026", "#buildinpublic",
+     ["senior_level", "build_in_public", "bio_mentions_available", "tech_data"]),
+    ("code_newbie_li", "Li Wei", "Career changer: teacher → developer | Learning Python through building | #100DaysOfCode Day 23 | Documenting everything", "#OpenToWork developer",
+     ["career_changer", "self_taught", "junior_level", "tech_python", "build_in_public"]),
+]
+
+_GAMING_MOCK_ROWS = [
+    ("retro_replay_yt", "RetroReplay", "Retro gaming YouTuber | 50K subs | Weekly reviews of classic arcade games | Pac-Man enthusiast | DMs open for collabs",
+     "#retrogaming arcade", ["gaming_youtuber", "gaming_retro", "gaming_arcade"]),
+    ("pixelquest_stream", "PixelQuest", "Twitch streamer | Retro arcade + indie browser games | 12K followers | Streaming since 2019 | Game recommendations welcome",
+     "#retrogaming arcade", ["gaming_streamer", "gaming_retro", "gaming_browser"]),
+    ("indiegame_weekly", "IndieGameWeekly", "Reviewing indie and browser games every Friday | 8K newsletter subscribers | Always looking for hidden gems | Submit your game!",
+     "#indiedev browser game", ["gaming_reviewer", "gaming_browser", "gaming_indiedev"]),
+    ("arcade_nostalgia", "ArcadeNostalgia", "Celebrating the golden age of arcade games | Collector + player | Documenting arcade history | Tetris world record attempt in progress",
+     "#retrogaming arcade", ["gaming_retro", "gaming_arcade", "active_in_gaming"]),
+    ("html5_gamedev", "HTML5GameDev", "Making browser games with Phaser.js and vanilla JS | #gamedev | Open source game engine contributor | Game jam veteran",
+     "#gamedev html5", ["gaming_indiedev", "gaming_browser", "has_game_repos"]),
+    ("casualgamer_sam", "CasualGamerSam", "I play free browser games so you don't have to | Reviews + rankings | 15K followers | Love puzzle and arcade games",
+     "free browser games", ["gaming_reviewer", "gaming_browser", "active_in_gaming"]),
+    ("screenshotsarah", "ScreenshotSarah", "Game dev | #screenshotsaturday regular | Building a retro-style arcade platformer | Pixel art + chiptune music",
+     "#screenshotsaturday arcade", ["gaming_indiedev", "gaming_retro", "gaming_arcade"]),
+    ("webgame_hub", "WebGameHub", "Curating the best free browser games | Daily recommendations | 20K followers | DM me your browser game!",
+     "free browser games", ["gaming_reviewer", "gaming_browser", "active_in_gaming"]),
+    ("retro_dev_mike", "RetroDevMike", "Remaking classic arcade games in JavaScript | Space Invaders clone got 500 stars on GitHub | Full-stack by day, game dev by night",
+     "#gamedev html5", ["gaming_indiedev", "gaming_retro", "gaming_arcade", "has_game_repos"]),
+    ("gamejam_junkie", "GameJamJunkie", "48-hour game jam addict | 15+ jams completed | Ludum Dare regular | Browser games only | Always down to playtest",
+     "#indiedev browser game", ["gaming_indiedev", "gaming_browser", "active_in_gaming"]),
+    ("pacman_stan", "PacManStan", "Pac-Man speedrunner | Classic arcade game historian | Writing a book about the golden age of arcades | 10K followers",
+     "#retrogaming arcade", ["gaming_retro", "gaming_arcade", "active_in_gaming"]),
+    ("indie_arcade_blog", "IndieArcadeBlog", "Blogging about indie arcade games since 2020 | Game reviews, developer interviews | 5K monthly readers",
+     "#indiedev browser game", ["gaming_blogger", "gaming_arcade", "gaming_indiedev"]),
+]
+
+# Built from the rows above on first use, then copied per fetch
+_MOCK_PROSPECTS: list[Prospect] | None = None
+_GAMING_MOCK_PROSPECTS: list[Prospect] | None = None
+
+
+def _pack_queries(queries: list) -> list[list]:
+    """Group queries so each group fits in a single `((q1) OR (q2) ...)` search.
+
+    Every search request counts against the app's rate limit, so short
+    hashtag queries are far cheaper sent together.
+    """
+    groups = []
+    group, length = [], len(_QUERY_SUFFIX)
+    for query in queries:
+        cost = len(query) + 2  # "(...)"
+        if group:
+            # " OR ", plus the outer parentheses once the group has two queries
+            cost += 4 + (2 if len(group) == 1 else 0)
+        if group and length + cost > MAX_QUERY_LENGTH:
+            groups.append(group)
+            group, length = [], len(_QUERY_SUFFIX)
+            cost = len(query) + 2
+        group.append(query)
+        length += cost
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _combine_queries(group: list) -> str:
+    if len(group) == 1:
+        return group[0]
+    # Outer parentheses so the suffix's -is:retweet lang:en applies to every
+    # query: X evaluates AND before OR, so it would otherwise bind to the last one
+    return f"({' OR '.join(f'({query})' for query in group)})"
+
+
+def _query_terms(group: list) -> list[tuple[str, str, list]]:
+    """(query, lowered query, lowered terms) for each query in a packed group,
+    computed once per search rather than for every tweet it returns."""
+    terms = []
+    for query in group:
+        lower = query.lower()
+        terms.append((query, lower, lower.split()))
+    return terms
+
+
+def _matched_query(terms: list, text_lower: str) -> tuple[str, str]:
+    """The first query in a packed group whose terms all appear in the tweet,
+    with its lowered form."""
+    if len(terms) > 1:
+        for query, lower, words in terms:
+            if all(word in text_lower for word in words):
+                return query, lower
+    return terms[0][0], terms[0][1]
+
 
 class XTwitterAdapter(BaseAdapter):
     name = "x_twitter"
@@ -19,29 +211,7 @@ class XTwitterAdapter(BaseAdapter):
     categories = ["Job Seekers", "AI/Prompt Engineers", "Build in Public"]
 
     def get_config_schema(self):
-        return {
-            "queries": {
-                "type": "list",
-                "label": "Search queries",
-                "default": [
-                    "#OpenToWork developer",
-                    "#buildinpublic",
-                    "laid off software engineer looking",
-                    "self-taught developer portfolio",
-                    "prompt engineer seeking",
-                ],
-            },
-            "max_results_per_query": {
-                "type": "number",
-                "label": "Max results per query",
-                "default": 20,
-            },
-            "bearer_token": {
-                "type": "password",
-                "label": "X API Bearer Token (optional - uses mock data if empty)",
-                "default": "",
-            },
-        }
+        return _CONFIG_SCHEMA
 
     async def fetch(self, config: dict) -> list[Prospect]:
         campaign = config.get("campaign", "memex")
@@ -53,173 +223,119 @@ class XTwitterAdapter(BaseAdapter):
         return await self._live_fetch(config, bearer, campaign)
 
     async def _live_fetch(self, config: dict, bearer: str, campaign: str = "memex") -> list[Prospect]:
-        default_queries = GAMING_QUERIES_X if campaign == "openarcade" else self.get_config_schema()["queries"]["default"]
+        default_queries = GAMING_QUERIES_X if campaign == "openarcade" else DEFAULT_QUERIES_X
         queries = config.get("queries", default_queries)
         max_per = config.get("max_results_per_query", 20)
         prospects = []
-        seen = set()
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            for query in queries:
-                try:
-                    resp = await client.get(
-                        "https://api.twitter.com/2/tweets/search/recent",
-                        params={
-                            "query": f"{query} -is:retweet lang:en",
-                            "max_results": min(max_per, 100),
-                            "tweet.fields": "author_id,created_at,public_metrics",
-                            "expansions": "author_id",
-                            "user.fields": "name,username,description,public_metrics,profile_image_url",
-                        },
-                        headers={"Authorization": f"Bearer {bearer}"},
-                    )
-                    if resp.status_code != 200:
-                        continue
-
-                    data = resp.json()
-                    users_map = {}
-                    for user in data.get("includes", {}).get("users", []):
-                        users_map[user["id"]] = user
-
-                    for tweet in data.get("data", []):
-                        author_id = tweet.get("author_id")
-                        user = users_map.get(author_id, {})
-                        username = user.get("username", "")
-                        if username in seen:
-                            continue
-                        seen.add(username)
-
-                        bio = user.get("description", "")
-                        signals = self._extract_signals(bio, tweet.get("text", ""), query)
-
-                        prospects.append(Prospect(
-                            source="x_twitter",
-                            username=username,
-                            display_name=user.get("name", username),
-                            profile_url=f"https://x.com/{username}",
-                            bio=bio,
-                            category=self._categorize(bio, signals, query),
-                            signals=signals,
-                            raw_data={
-                                "tweet_text": tweet.get("text", ""),
-                                "tweet_id": tweet.get("id"),
-                                "followers": user.get("public_metrics", {}).get("followers_count", 0),
-                                "following": user.get("public_metrics", {}).get("following_count", 0),
-                                "tweet_likes": tweet.get("public_metrics", {}).get("like_count", 0),
-                                "query_matched": query,
-                                "created_at": tweet.get("created_at"),
-                            },
-                        ))
-                except httpx.TimeoutException:
-                    continue
 
-        return prospects
+        client = get_client()
+        headers = {"Authorization": f"Bearer {bearer}"}
+        sem = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+        groups = _pack_queries(queries)
+        # Searches run concurrently; results are then walked in query order
+        results = await asyncio.gather(*(
+            self._search_recent(client, sem, _combine_queries(group), min(max_per * len(group), 100), headers)
+            for group in groups
+        ), return_exceptions=True)
 
-    def _mock_data(self, config: dict) -> list[Prospect]:
-        """Return realistic mock data when no API key is available."""
-        mocks = [
-            ("sarahcodes_", "Sarah Chen", "Self-taught dev | Day 87 of #100DaysOfCode | Building a habit tracker in React | Previously in marketing | Open to junior roles", "#OpenToWork developer",
-             ["bio_mentions_open_to", "self_taught", "career_changer", "tech_react"]),
-            ("rustacean_mike", "Mike Okonkwo", "Rust + WebAssembly | Ex-FAANG, laid off Jan 2026 | Building CLI tools in public | DMs open for collab", "laid off software engineer looking",
-             ["bio_mentions_laid_off", "senior_level", "tech_rust", "build_in_public"]),
-            ("promptcraft_ai", "Jess Rivera", "Prompt engineer & AI workflow designer | I make LLMs do things they shouldn't be able to | Freelance available", "prompt engineer seeking",
-             ["freelance_available", "ai_prompt_engineer", "bio_mentions_available"]),
-            ("fullstack_nomad", "Alex Petrov", "Digital nomad | Full-stack TS/React/Node | Building SaaS products from Lisbon | #buildinpublic | Portfolio: alexdev.io", "#buildinpublic",
-             ["fullstack", "digital_nomad", "build_in_public", "has_website", "tech_typescript"]),
-            ("boot2code", "Priya Sharma", "Flatiron grad '25 | Python + Django | Looking for my first role | Love pair programming | She/her", "#OpenToWork developer",
-             ["bootcamp_grad", "junior_level", "bio_mentions_looking_for", "tech_python"]),
-            ("ml_marcus", "Marcus Johnson", "ML Engineer | PyTorch + Transformers | Fine-tuning LLMs on weekends | Open to contract work | ex-research at university lab", "prompt engineer seeking",
-             ["tech_machine_learning", "freelance_available", "senior_level"]),
-            ("designdev_kate", "Kate Nakamura", "Design engineer → Full-stack dev | Career changer | Building in Svelte + Go | #100DaysOfCode Day 45", "#buildinpublic",
-             ["career_changer", "self_taught", "tech_go", "build_in_public"]),
-            ("indie_hacker_tom", "Tom Blackwood", "Indie hacker | 3 shipped products, 0 that make money yet | Currently building an AI writing tool | #buildinpublic", "#buildinpublic",
-             ["build_in_public", "indie_hacker", "tech_ai", "has_shipped_products"]),
-            ("dao_contrib_sam", "Sam Osei", "DAO contributor | Solidity + React | Built governance tools for 3 DAOs | Seeking full-time web3 role", "#OpenToWork developer",
-             ["tech_solidity", "web3", "bio_mentions_seeking", "has_portfolio"]),
-            ("junior_jana", "Jana Mueller", "CS student → self-taught web dev | Left academia for tech | Building React apps | Looking for internship/junior role in Berlin", "#OpenToWork developer",
-             ["junior_level", "career_changer", "tech_react", "bio_mentions_looking_for"]),
-            ("devops_diana", "Diana Reyes", "SRE/DevOps | AWS + Terraform + K8s | Just got laid off from Series B startup | 8 years exp | Open to remote", "laid off software engineer looking",
-             ["senior_level", "bio_mentions_laid_off", "tech_devops", "wants_remote"]),
-            ("ai_artisan", "Kai Thompson", "AI image generation + workflow automation | Building custom Stable Diffusion pipelines | Freelance open", "prompt engineer seeking",
-             ["ai_prompt_engineer", "freelance_available", "tech_ai"]),
-            ("react_queen", "Aisha Williams", "React/Next.js specialist | 5 years frontend | Contributor to Radix UI | Exploring new opportunities post-layoff", "laid off software engineer looking",
-             ["senior_level", "bio_mentions_laid_off", "tech_react", "open_source_contributor"]),
-            ("data_dave", "Dave Kowalski", "Data engineer | Spark + dbt + Snowflake | Ex-fintech | Building a personal data stack in public | Available Q1 2026", "#buildinpublic",
-             ["senior_level", "build_in_public", "bio_mentions_available", "tech_data"]),
-            ("code_newbie_li", "Li Wei", "Career changer: teacher → developer | Learning Python through building | #100DaysOfCode Day 23 | Documenting everything", "#OpenToWork developer",
-             ["career_changer", "self_taught", "junior_level", "tech_python", "build_in_public"]),
-        ]
+        # Keep each user's most-liked tweet across all searches; dict order
+        # still follows first appearance, so ranking ties behave as before
+        best: dict[str, tuple[int, dict, dict, list]] = {}
+        for group, data in zip(groups, results):
+            if isinstance(data, httpx.TimeoutException) or data is None:
+                continue
+            if isinstance(data, BaseException):
+                raise data
+            terms = _query_terms(group)
+
+            users_map = {}
+            for user in data.get("includes", {}).get("users", []):
+                users_map[user["id"]] = user
+
+            for tweet in data.get("data", []):
+                user = users_map.get(tweet.get("author_id"), _EMPTY)
+                username = user.get("username", "")
+                likes = (tweet.get("public_metrics") or _EMPTY).get("like_count", 0)
+                current = best.get(username)
+                if current is None or likes > current[0]:
+                    best[username] = (likes, tweet, user, terms)
+
+        for username, (likes, tweet, user, terms) in best.items():
+            bio = user.get("description", "")
+            text = tweet.get("text", "")
+            metrics = user.get("public_metrics") or _EMPTY
+            query, query_lower = _matched_query(terms, text.lower())
+            signals = self._extract_signals(bio, text, query)
 
-        prospects = []
-        for username, name, bio, query, signals in mocks:
             prospects.append(Prospect(
                 source="x_twitter",
                 username=username,
-                display_name=name,
+                display_name=user.get("name", username),
                 profile_url=f"https://x.com/{username}",
                 bio=bio,
-                category=self._categorize(bio, signals, query),
+                category=self._categorize(bio, signals, query_lower),
                 signals=signals,
                 raw_data={
-                    "tweet_text": f"[Mock] Based on query: {query}",
-                    "followers": 0,
+                    "tweet_text": text,
+                    "tweet_id": tweet.get("id"),
+                    "followers": metrics.get("followers_count", 0),
+                    "following": metrics.get("following_count", 0),
+                    "tweet_likes": likes,
                     "query_matched": query,
-                    "is_mock": True,
+                    "created_at": tweet.get("created_at"),
                 },
             ))
 
         return prospects
 
+    async def _search_recent(self, client: httpx.AsyncClient, sem: asyncio.Semaphore, query: str,
+                             max_results: int, headers: dict) -> dict | None:
+        """Run one recent-tweets search; returns the decoded payload, or None on a non-200."""
+        async with sem:
+            resp = await client.get(
+                SEARCH_URL,
+                params={"query": f"{query}{_QUERY_SUFFIX}", "max_results": max_results, **_SEARCH_FIELDS},
+                headers=headers,
+            )
+        if resp.status_code != 200:
+            return None
+        return orjson.loads(resp.content)
+
+    def _mock_data(self, config: dict) -> list[Prospect]:
+        """Return realistic mock data when no API key is available."""
+        global _MOCK_PROSPECTS
+        if _MOCK_PROSPECTS is None:
+            _MOCK_PROSPECTS = [self._mock_prospect(row, self._categorize) for row in _MOCK_ROWS]
+        now = time.time()
+        return [replace(p, fetched_at=now) for p in _MOCK_PROSPECTS]
+
     def _gaming_mock_data(self, config: dict) -> list[Prospect]:
         """Return realistic gaming-focused mock data for OpenArcade campaign."""
-        mocks = [
-            ("retro_replay_yt", "RetroReplay", "Retro gaming YouTuber | 50K subs | Weekly reviews of classic arcade games | Pac-Man enthusiast | DMs open for collabs",
-             "#retrogaming arcade", ["gaming_youtuber", "gaming_retro", "gaming_arcade"]),
-            ("pixelquest_stream", "PixelQuest", "Twitch streamer | Retro arcade + indie browser games | 12K followers | Streaming since 2019 | Game recommendations welcome",
-             "#retrogaming arcade", ["gaming_streamer", "gaming_retro", "gaming_browser"]),
-            ("indiegame_weekly", "IndieGameWeekly", "Reviewing indie and browser games every Friday | 8K newsletter subscribers | Always looking for hidden gems | Submit your game!",
-             "#indiedev browser game", ["gaming_reviewer", "gaming_browser", "gaming_indiedev"]),
-            ("arcade_nostalgia", "ArcadeNostalgia", "Celebrating the golden age of arcade games | Collector + player | Documenting arcade history | Tetris world record attempt in progress",
-             "#retrogaming arcade", ["gaming_retro", "gaming_arcade", "active_in_gaming"]),
-            ("html5_gamedev", "HTML5GameDev", "Making browser games with Phaser.js and vanilla JS | #gamedev | Open source game engine contributor | Game jam veteran",
-             "#gamedev html5", ["gaming_indiedev", "gaming_browser", "has_game_repos"]),
-            ("casualgamer_sam", "CasualGamerSam", "I play free browser games so you don't have to | Reviews + rankings | 15K followers | Love puzzle and arcade games",
-             "free browser games", ["gaming_reviewer", "gaming_browser", "active_in_gaming"]),
-            ("screenshotsarah", "ScreenshotSarah", "Game dev | #screenshotsaturday regular | Building a retro-style arcade platformer | Pixel art + chiptune music",
-             "#screenshotsaturday arcade", ["gaming_indiedev", "gaming_retro", "gaming_arcade"]),
-            ("webgame_hub", "WebGameHub", "Curating the best free browser games | Daily recommendations | 20K followers | DM me your browser game!",
-             "free browser games", ["gaming_reviewer", "gaming_browser", "active_in_gaming"]),
-            ("retro_dev_mike", "RetroDevMike", "Remaking classic arcade games in JavaScript | Space Invaders clone got 500 stars on GitHub | Full-stack by day, game dev by night",
-             "#gamedev html5", ["gaming_indiedev", "gaming_retro", "gaming_arcade", "has_game_repos"]),
-            ("gamejam_junkie", "GameJamJunkie", "48-hour game jam addict | 15+ jams completed | Ludum Dare regular | Browser games only | Always down to playtest",
-             "#indiedev browser game", ["gaming_indiedev", "gaming_browser", "active_in_gaming"]),
-            ("pacman_stan", "PacManStan", "Pac-Man speedrunner | Classic arcade game historian | Writing a book about the golden age of arcades | 10K followers",
-             "#retrogaming arcade", ["gaming_retro", "gaming_arcade", "active_in_gaming"]),
-            ("indie_arcade_blog", "IndieArcadeBlog", "Blogging about indie arcade games since 2020 | Game reviews, developer interviews | 5K monthly readers",
-             "#indiedev browser game", ["gaming_blogger", "gaming_arcade", "gaming_indiedev"]),
-        ]
-
-        prospects = []
-        for username, name, bio, query, signals in mocks:
-            prospects.append(Prospect(
-                source="x_twitter",
-                username=username,
-                display_name=name,
-                profile_url=f"https://x.com/{username}",
-                bio=bio,
-                category=self._categorize_gaming(bio, signals, query),
-                signals=signals,
-                raw_data={
-                    "tweet_text": f"[Mock] Based on query: {query}",
-                    "followers": 0,
-                    "query_matched": query,
-                    "is_mock": True,
-                },
-            ))
+        global _GAMING_MOCK_PROSPECTS
+        if _GAMING_MOCK_PROSPECTS is None:
+            _GAMING_MOCK_PROSPECTS = [self._mock_prospect(row, self._categorize_gaming) for row in _GAMING_MOCK_ROWS]
+        now = time.time()
+        return [replace(p, fetched_at=now) for p in _GAMING_MOCK_PROSPECTS]
 
-        return prospects
+    def _mock_prospect(self, row: tuple, categorize) -> Prospect:
+        username, name, bio, query, signals = row
+        return Prospect(
+            source="x_twitter",
+            username=username,
+            display_name=name,
+            profile_url=f"https://x.com/{username}",
+            bio=bio,
+            category=categorize(bio, signals, query.lower()),
+            signals=signals,
+            raw_data={
+                "tweet_text": f"[Mock] Based on query: {query}",
+                "followers": 0,
+                "query_matched": query,
+                "is_mock": True,
+            },
+        )
 
-    def _categorize_gaming(self, bio: str, signals: list, query: str) -> str:
+    def _categorize_gaming(self, bio: str, signals: list, query_lower: str) -> str:
         if "gaming_youtuber" in signals:
             return "Gaming YouTuber"
         if "gaming_streamer" in signals:
@@ -237,36 +353,13 @@ class XTwitterAdapter(BaseAdapter):
         return "Game Developer"
 
     def _extract_signals(self, bio: str, tweet: str, query: str) -> list:
-        signals = []
         combined = f"{bio} {tweet}".lower()
-        for kw, signal in [
-            ("open to", "bio_mentions_open_to"),
-            ("looking for", "bio_mentions_looking_for"),
-            ("seeking", "bio_mentions_seeking"),
-            ("available", "bio_mentions_available"),
-            ("laid off", "bio_mentions_laid_off"),
-            ("freelance", "freelance_available"),
-            ("self-taught", "self_taught"),
-            ("bootcamp", "bootcamp_grad"),
-            ("career change", "career_changer"),
-            ("#buildinpublic", "build_in_public"),
-            ("#100daysofcode", "100_days_of_code"),
-            ("remote", "wants_remote"),
-            ("senior", "senior_level"),
-            ("junior", "junior_level"),
-        ]:
-            if kw in combined:
-                signals.append(signal)
-        for tech in ["python", "rust", "go ", "typescript", "react", "machine learning", "ai ", "llm", "solidity"]:
-            if tech in combined:
-                signals.append(f"tech_{tech.strip().replace(' ', '_')}")
-        return signals
-
-    def _categorize(self, bio: str, signals: list, query: str) -> str:
-        bio_lower = bio.lower()
+        return [signal for kw, signal in _TEXT_SIGNALS if kw in combined]
+
+    def _categorize(self, bio: str, signals: list, query_lower: str) -> str:
         if "build_in_public" in signals or "indie_hacker" in signals:
             return "Build in Public"
-        if "ai_prompt_engineer" in signals or "prompt engineer" in query.lower():
+        if "ai_prompt_engineer" in signals or "prompt engineer" in query_lower:
             return "AI/Prompt Engineer"
         if "career_changer" in signals:
             return "Career Changer"
@@ -1,15 +1,105 @@
 import aiosqlite
+import asyncio
 import json
+import orjson
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 from adapters.base import Prospect
 
 DB_PATH = Path(__file__).parent / "data" / "prospector.db"
 
+# sqlite3 keeps compiled statements per connection, keyed by SQL text. Every
+# query here is a constant string, so each is prepared once per connection;
+# this just leaves headroom above the 128 default as queries are added.
+_STATEMENT_CACHE_SIZE = 256
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# How often the background task folds the WAL back into the main file
+CHECKPOINT_INTERVAL = 60
+
+# One long-lived connection instead of a connect/close (and aiosqlite worker
+# thread) per call. aiosqlite runs its statements one at a time on that thread;
+# the lock keeps each writer's statements and commit together.
+_conn: aiosqlite.Connection | None = None
+_write_lock = asyncio.Lock()
+
+# Reads skip aiosqlite's command queue: a plain sqlite3 connection per worker
+# thread runs each short SELECT directly. Under WAL these readers don't wait
+# for an in-progress save on the shared writer connection either.
+_read_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="db-read")
+_read_conns: dict[int, sqlite3.Connection] = {}
+
+_checkpoint_task: asyncio.Task | None = None
+
+
+async def get_conn() -> aiosqlite.Connection:
+    global _conn
+    if _conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = await aiosqlite.connect(DB_PATH, cached_statements=_STATEMENT_CACHE_SIZE)
+        conn.row_factory = aiosqlite.Row
+        # WAL lets readers proceed while a run is being saved; NORMAL sync is
+        # durable across app crashes and skips an fsync per commit
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        await conn.execute("PRAGMA cache_size=-64000")
+        # Checkpoint every ~4MB of WAL and truncate it back to 64MB afterwards,
+        # so stats reads don't have to search a WAL that grows during long runs
+        await conn.execute("PRAGMA wal_autocheckpoint=1000")
+        await conn.execute("PRAGMA journal_size_limit=67108864")
+        _conn = conn
+    return _conn
+
+
+def _read_conn() -> sqlite3.Connection:
+    """The calling read thread's connection, opened on first use."""
+    conn = _read_conns.get(threading.get_ident())
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        _read_conns[threading.get_ident()] = conn
+    return conn
+
+
+async def _checkpoint_periodically():
+    while True:
+        await asyncio.sleep(CHECKPOINT_INTERVAL)
+        # Skip a round rather than queue behind a pipeline run that is saving
+        if _write_lock.locked():
+            continue
+        db = await get_conn()
+        async with _write_lock:
+            await db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def start_checkpoints():
+    """Start the periodic WAL checkpoint task; called on app startup."""
+    global _checkpoint_task
+    if _checkpoint_task is None or _checkpoint_task.done():
+        _checkpoint_task = asyncio.create_task(_checkpoint_periodically())
+
+
+async def close_db():
+    """Close the shared connection and read connections; called on app shutdown."""
+    global _conn, _checkpoint_task
+    if _checkpoint_task is not None:
+        _checkpoint_task.cancel()
+        _checkpoint_task = None
+    if _conn is not None:
+        await _conn.close()
+        _conn = None
+    while _read_conns:
+        _read_conns.popitem()[1].close()
+
 
 async def init_db():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    async with aiosqlite.connect(DB_PATH) as db:
+    db = await get_conn()
+    async with _write_lock:
         await db.executescript("""
             CREATE TABLE IF NOT EXISTS runs (
                 id TEXT PRIMARY KEY,
@@ -20,6 +110,7 @@ async def init_db():
                 log TEXT,
                 campaign TEXT DEFAULT 'memex'
             );
+            CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at);
             CREATE TABLE IF NOT EXISTS prospects (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 run_id TEXT NOT NULL,
@@ -44,7 +135,37 @@ async def init_db():
             CREATE INDEX IF NOT EXISTS idx_prospects_score ON prospects(final_score DESC);
             CREATE UNIQUE INDEX IF NOT EXISTS idx_prospects_source_user_run
                 ON prospects(run_id, source, username);
+            CREATE INDEX IF NOT EXISTS idx_prospects_dedup
+                ON prospects(source, username, final_score DESC);
+            -- Covering indexes so the stats page's GROUP BYs never touch the table
+            CREATE INDEX IF NOT EXISTS idx_prospects_source_score
+                ON prospects(source, final_score);
+            CREATE INDEX IF NOT EXISTS idx_prospects_category_score
+                ON prospects(category, final_score) WHERE category IS NOT NULL AND category != '';
+            CREATE INDEX IF NOT EXISTS idx_prospects_fetched ON prospects(fetched_at);
+            -- One row per prospect signal, so signal stats are plain indexed
+            -- queries instead of JSON decoding in Python
+            CREATE TABLE IF NOT EXISTS prospect_signals (
+                prospect_id INTEGER NOT NULL,
+                signal TEXT NOT NULL,
+                PRIMARY KEY (prospect_id, signal)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_prospect_signals_signal ON prospect_signals(signal);
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT NOT NULL,
+                fetched_at REAL
+            );
+        """)
+        # Migration: fill prospect_signals from the JSON column for existing DBs
+        await db.execute("""
+            INSERT OR IGNORE INTO prospect_signals (prospect_id, signal)
+            SELECT p.id, j.value FROM prospects p, json_each(p.signals) j
+            WHERE NOT EXISTS (SELECT 1 FROM prospect_signals)
         """)
+        await db.commit()
         # Migration: add campaign column if it doesn't exist (for existing DBs)
         try:
             await db.execute("ALTER TABLE runs ADD COLUMN campaign TEXT DEFAULT 'memex'")
@@ -53,10 +174,16 @@ async def init_db():
             pass  # Column already exists
 
 
+def _dumps(obj) -> str:
+    # Decoded to str so SQLite stores TEXT, not a BLOB that json_each rejects
+    return orjson.dumps(obj).decode()
+
+
 async def save_run(run_id: str, status: str, started_at: float,
                    finished_at: float = None, adapters_used: list = None, log: list = None,
                    campaign: str = "memex"):
-    async with aiosqlite.connect(DB_PATH) as db:
+    db = await get_conn()
+    async with _write_lock:
         await db.execute("""
             INSERT OR REPLACE INTO runs (id, status, started_at, finished_at, adapters_used, log, campaign)
             VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -65,166 +192,271 @@ async def save_run(run_id: str, status: str, started_at: float,
         await db.commit()
 
 
+async def set_run_status(run_id: str, status: str):
+    db = await get_conn()
+    async with _write_lock:
+        await db.execute("UPDATE runs SET status = ? WHERE id = ?", (status, run_id))
+        await db.commit()
+
+
+def _prospect_rows(run_id: str, prospects: list[Prospect]) -> list[tuple]:
+    # Serialize up front so the whole batch goes down in one executemany call
+    return [
+        (run_id, p.source, p.username, p.display_name, p.profile_url,
+         p.bio, p.category, _dumps(p.signals), _dumps(p.raw_data),
+         p.trust_gap_score, p.reachability_score, p.relevance_score,
+         p.final_score, p.outreach_message, p.fetched_at)
+        for p in prospects
+    ]
+
+
+async def _insert_prospects(db: aiosqlite.Connection, run_id: str, rows: list[tuple]):
+    """Write a run's prospects and their signal rows. Caller holds _write_lock and commits."""
+    # Rows replaced below get new ids, so drop the run's old signal rows first
+    await db.execute("""
+        DELETE FROM prospect_signals
+        WHERE prospect_id IN (SELECT id FROM prospects WHERE run_id = ?)
+    """, (run_id,))
+    await db.executemany("""
+        INSERT OR REPLACE INTO prospects
+        (run_id, source, username, display_name, profile_url, bio, category,
+         signals, raw_data, trust_gap_score, reachability_score, relevance_score,
+         final_score, outreach_message, fetched_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    # Expanded in SQL, which avoids reading the new ids back
+    await db.execute("""
+        INSERT OR IGNORE INTO prospect_signals (prospect_id, signal)
+        SELECT p.id, j.value FROM prospects p, json_each(p.signals) j
+        WHERE p.run_id = ?
+    """, (run_id,))
+
+
 async def save_prospects(run_id: str, prospects: list[Prospect]):
-    async with aiosqlite.connect(DB_PATH) as db:
-        for p in prospects:
-            await db.execute("""
-                INSERT OR REPLACE INTO prospects
-                (run_id, source, username, display_name, profile_url, bio, category,
-                 signals, raw_data, trust_gap_score, reachability_score, relevance_score,
-                 final_score, outreach_message, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (run_id, p.source, p.username, p.display_name, p.profile_url,
-                  p.bio, p.category, json.dumps(p.signals), json.dumps(p.raw_data),
-                  p.trust_gap_score, p.reachability_score, p.relevance_score,
-                  p.final_score, p.outreach_message, p.fetched_at))
+    rows = _prospect_rows(run_id, prospects)
+    db = await get_conn()
+    async with _write_lock:
+        await _insert_prospects(db, run_id, rows)
         await db.commit()
 
 
+async def finish_run(run_id: str, prospects: list[Prospect], finished_at: float,
+                     adapters_used: list = None, log: list = None) -> list[dict]:
+    """Save a run's prospects and mark it done in one transaction.
+
+    The run row is updated rather than replaced, so its started_at and
+    campaign are kept. Returns the saved prospects (as get_run_prospects
+    would), read back on the writer connection before the commit.
+    """
+    rows = _prospect_rows(run_id, prospects)
+    db = await get_conn()
+    async with _write_lock:
+        await _insert_prospects(db, run_id, rows)
+        await db.execute("""
+            UPDATE runs SET status = 'done', finished_at = ?, adapters_used = ?, log = ?
+            WHERE id = ?
+        """, (finished_at, json.dumps(adapters_used or []), json.dumps(log or []), run_id))
+        async with db.execute("""
+            SELECT * FROM prospects WHERE run_id = ? ORDER BY final_score DESC
+        """, (run_id,)) as cursor:
+            saved = [_row_to_prospect_dict(dict(r)) for r in await cursor.fetchall()]
+        await db.commit()
+    return saved
+
+
 async def update_prospect_outreach(prospect_id: int, message: str, deep_profile: dict = None):
-    async with aiosqlite.connect(DB_PATH) as db:
+    db = await get_conn()
+    async with _write_lock:
         await db.execute("""
             UPDATE prospects SET outreach_message = ?, deep_profile = ? WHERE id = ?
-        """, (message, json.dumps(deep_profile) if deep_profile else None, prospect_id))
+        """, (message, _dumps(deep_profile) if deep_profile else None, prospect_id))
         await db.commit()
 
 
+def _sync_fetchone(sql: str, params: tuple) -> dict | None:
+    row = _read_conn().execute(sql, params).fetchone()
+    return dict(row) if row else None
+
+
+def _sync_fetchall(sql: str, params: tuple) -> list[dict]:
+    return [dict(r) for r in _read_conn().execute(sql, params).fetchall()]
+
+
+async def _fetchone(sql: str, params: tuple = ()) -> dict | None:
+    return await asyncio.get_running_loop().run_in_executor(_read_pool, _sync_fetchone, sql, params)
+
+
+async def _fetchall(sql: str, params: tuple = ()) -> list[dict]:
+    return await asyncio.get_running_loop().run_in_executor(_read_pool, _sync_fetchall, sql, params)
+
+
 async def get_all_runs():
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("""
-            SELECT r.*, COUNT(p.id) as prospect_count
-            FROM runs r LEFT JOIN prospects p ON r.id = p.run_id
-            GROUP BY r.id ORDER BY r.started_at DESC
-        """)
-        rows = await cursor.fetchall()
-        return [dict(r) for r in rows]
+    return await _fetchall("""
+        SELECT r.*, COUNT(p.id) as prospect_count
+        FROM runs r LEFT JOIN prospects p ON r.id = p.run_id
+        GROUP BY r.id ORDER BY r.started_at DESC
+    """)
 
 
 async def get_run_by_id(run_id: str) -> dict | None:
-    async with aiosqlite.connect(DB_PATH) as conn:
-        conn.row_factory = aiosqlite.Row
-        cursor = await conn.execute("""
-            SELECT r.*, COUNT(p.id) as prospect_count
-            FROM runs r LEFT JOIN prospects p ON r.id = p.run_id
-            WHERE r.id = ?
-            GROUP BY r.id
-        """, (run_id,))
-        row = await cursor.fetchone()
-        return dict(row) if row else None
+    return await _fetchone("""
+        SELECT r.*, COUNT(p.id) as prospect_count
+        FROM runs r LEFT JOIN prospects p ON r.id = p.run_id
+        WHERE r.id = ?
+        GROUP BY r.id
+    """, (run_id,))
 
 
 async def get_run_campaign(run_id: str) -> str:
     """Get the campaign for a run. Returns 'memex' as default."""
-    async with aiosqlite.connect(DB_PATH) as conn:
-        conn.row_factory = aiosqlite.Row
-        cursor = await conn.execute("SELECT campaign FROM runs WHERE id = ?", (run_id,))
-        row = await cursor.fetchone()
-        return (dict(row).get("campaign") or "memex") if row else "memex"
+    row = await _fetchone("SELECT campaign FROM runs WHERE id = ?", (run_id,))
+    return (row.get("campaign") or "memex") if row else "memex"
 
 
 async def get_run_prospects(run_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("""
-            SELECT * FROM prospects WHERE run_id = ? ORDER BY final_score DESC
-        """, (run_id,))
-        rows = await cursor.fetchall()
-        return [_row_to_prospect_dict(dict(r)) for r in rows]
-
-
-async def get_all_prospects():
-    """Get all prospects across all runs, deduped by source+username, keeping highest score."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("""
-            SELECT p.*, r.started_at as run_started_at
-            FROM prospects p
-            JOIN runs r ON p.run_id = r.id
-            WHERE p.id IN (
-                SELECT id FROM prospects p2
-                WHERE p2.source = p.source AND p2.username = p.username
-                ORDER BY p2.final_score DESC LIMIT 1
-            )
-            ORDER BY p.final_score DESC
-        """)
-        rows = await cursor.fetchall()
-        return [_row_to_prospect_dict(dict(r)) for r in rows]
+    rows = await _fetchall("""
+        SELECT * FROM prospects WHERE run_id = ? ORDER BY final_score DESC
+    """, (run_id,))
+    return [_row_to_prospect_dict(r) for r in rows]
+
+
+async def get_all_prospects(source: str = None, category: str = None,
+                            min_score: float = None, limit: int = None, offset: int = None):
+    """Get all prospects across all runs, deduped by source+username, keeping highest score.
+
+    Filters apply after dedup, so they narrow the deduped list rather than
+    changing which row wins for a user. limit/offset page through the result
+    in score order.
+    """
+    where, params = [], []
+    if source:
+        where.append("p.source = ?")
+        params.append(source)
+    if category:
+        where.append("p.category = ?")
+        params.append(category)
+    if min_score is not None:
+        where.append("p.final_score >= ?")
+        params.append(min_score)
+    filters = "".join(f"\n        AND {clause}" for clause in where)
+    limit_clause = ""
+    if limit is not None or offset:
+        # SQLite needs a LIMIT before OFFSET; -1 means no limit
+        limit_clause = "\n        LIMIT ?"
+        params.append(limit if limit is not None else -1)
+        if offset:
+            limit_clause += " OFFSET ?"
+            params.append(offset)
+
+    rows = await _fetchall(f"""
+        SELECT p.*, r.started_at as run_started_at
+        FROM prospects p
+        JOIN runs r ON p.run_id = r.id
+        WHERE p.id IN (
+            -- One pass over the dedup index instead of a subquery per row
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY source, username ORDER BY final_score DESC, id
+                ) AS rn
+                FROM prospects
+            ) WHERE rn = 1
+        ){filters}
+        ORDER BY p.final_score DESC, p.id{limit_clause}
+    """, tuple(params))
+    return [_row_to_prospect_dict(r) for r in rows]
 
 
 async def get_prospect_by_id(prospect_id: int):
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("SELECT * FROM prospects WHERE id = ?", (prospect_id,))
-        row = await cursor.fetchone()
-        if row:
-            return _row_to_prospect_dict(dict(row))
-        return None
+    row = await _fetchone("SELECT * FROM prospects WHERE id = ?", (prospect_id,))
+    if row:
+        return _row_to_prospect_dict(row)
+    return None
 
 
 def _row_to_prospect_dict(row: dict) -> dict:
-    row["signals"] = json.loads(row.get("signals") or "[]")
-    row["raw_data"] = json.loads(row.get("raw_data") or "{}")
-    row["deep_profile"] = json.loads(row.get("deep_profile") or "null")
+    row["signals"] = orjson.loads(row.get("signals") or "[]")
+    row["raw_data"] = orjson.loads(row.get("raw_data") or "{}")
+    row["deep_profile"] = orjson.loads(row.get("deep_profile") or "null")
     return row
 
 
-async def get_daily_prospect_counts(days: int = 30) -> list[dict]:
-    """Get number of prospects found per day."""
-    async with aiosqlite.connect(DB_PATH) as conn:
-        conn.row_factory = aiosqlite.Row
-        cursor = await conn.execute("""
-            SELECT date(fetched_at, 'unixepoch') as date, COUNT(*) as count
-            FROM prospects
-            WHERE fetched_at > (strftime('%s', 'now') - ? * 86400)
-            GROUP BY date(fetched_at, 'unixepoch')
-            ORDER BY date
-        """, (days,))
-        return [dict(r) for r in await cursor.fetchall()]
+async def get_http_cache(url: str) -> dict | None:
+    """Get the cached response body and validators for a URL."""
+    return await _fetchone("SELECT * FROM http_cache WHERE url = ?", (url,))
 
 
-async def get_daily_run_counts(days: int = 30) -> list[dict]:
-    """Get number of pipeline runs per day."""
-    async with aiosqlite.connect(DB_PATH) as conn:
-        conn.row_factory = aiosqlite.Row
-        cursor = await conn.execute("""
-            SELECT date(started_at, 'unixepoch') as date, COUNT(*) as count
-            FROM runs
-            WHERE started_at > (strftime('%s', 'now') - ? * 86400)
-            GROUP BY date(started_at, 'unixepoch')
-            ORDER BY date
-        """, (days,))
-        return [dict(r) for r in await cursor.fetchall()]
+async def save_http_cache(url: str, body: str, etag: str = None, last_modified: str = None):
+    db = await get_conn()
+    async with _write_lock:
+        await db.execute("""
+            INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (url, etag, last_modified, body, time.time()))
+        await db.commit()
 
 
-async def get_stats_summary() -> dict:
-    """Get aggregate stats for the stats page."""
-    async with aiosqlite.connect(DB_PATH) as conn:
-        conn.row_factory = aiosqlite.Row
+async def touch_http_cache(url: str):
+    """Mark a cached response as fresh again after a 304 revalidation."""
+    db = await get_conn()
+    async with _write_lock:
+        await db.execute("UPDATE http_cache SET fetched_at = ? WHERE url = ?", (time.time(), url))
+        await db.commit()
+
 
-        cur = await conn.execute("SELECT COUNT(*) as total FROM prospects")
-        total_prospects = (await cur.fetchone())["total"]
+def _day_counts(rows: list[dict]) -> tuple[list[str], list[int]]:
+    """Split (day number since epoch, count) rows into parallel ISO dates and
+    counts, rather than building a {date, count} dict per day."""
+    dates = [date.fromordinal(_EPOCH_ORDINAL + r["day"]).isoformat() for r in rows]
+    counts = [r["count"] for r in rows]
+    return dates, counts
 
-        cur = await conn.execute("SELECT COUNT(*) as total FROM prospects WHERE outreach_message IS NOT NULL AND outreach_message != ''")
-        total_outreach = (await cur.fetchone())["total"]
 
-        cur = await conn.execute("SELECT COUNT(*) as total FROM runs")
-        total_runs = (await cur.fetchone())["total"]
+async def get_daily_prospect_counts(days: int = 30) -> tuple[list[str], list[int]]:
+    """Get number of prospects found per day."""
+    # Integer day buckets over the indexed timestamp, instead of formatting a
+    # date string for every row; the cutoff is computed once here
+    return _day_counts(await _fetchall("""
+        SELECT CAST(fetched_at / 86400 AS INTEGER) as day, COUNT(*) as count
+        FROM prospects
+        WHERE fetched_at > ?
+        GROUP BY day
+        ORDER BY day
+    """, (int(time.time()) - days * 86400,)))
+
+
+async def get_daily_run_counts(days: int = 30) -> tuple[list[str], list[int]]:
+    """Get number of pipeline runs per day."""
+    return _day_counts(await _fetchall("""
+        SELECT CAST(started_at / 86400 AS INTEGER) as day, COUNT(*) as count
+        FROM runs
+        WHERE started_at > ?
+        GROUP BY day
+        ORDER BY day
+    """, (int(time.time()) - days * 86400,)))
 
-        cur = await conn.execute("""
+
+async def get_stats_summary() -> dict:
+    """Get aggregate stats for the stats page."""
+    # Already aggregated in SQL; the five queries run side by side on the read
+    # pool rather than one after another
+    totals, by_source, by_category, score_dist, by_signal = await asyncio.gather(
+        # All three totals in one round trip and one pass over prospects
+        _fetchone("""
+            SELECT COUNT(*) as total_prospects,
+                   COUNT(NULLIF(outreach_message, '')) as total_outreach,
+                   (SELECT COUNT(*) FROM runs) as total_runs
+            FROM prospects
+        """),
+        _fetchall("""
             SELECT source, COUNT(*) as count, AVG(final_score) as avg_score
             FROM prospects GROUP BY source ORDER BY count DESC
-        """)
-        by_source = [dict(r) for r in await cur.fetchall()]
-
-        cur = await conn.execute("""
+        """),
+        _fetchall("""
             SELECT category, COUNT(*) as count, AVG(final_score) as avg_score
             FROM prospects WHERE category IS NOT NULL AND category != ''
             GROUP BY category ORDER BY count DESC
-        """)
-        by_category = [dict(r) for r in await cur.fetchall()]
-
-        cur = await conn.execute("""
+        """),
+        _fetchall("""
             SELECT
                 CASE
                     WHEN final_score < 0.2 THEN '0.0-0.2'
@@ -235,14 +467,17 @@ async def get_stats_summary() -> dict:
                 END as bucket,
                 COUNT(*) as count
             FROM prospects GROUP BY bucket ORDER BY bucket
-        """)
-        score_dist = [dict(r) for r in await cur.fetchall()]
-
-        return {
-            "total_prospects": total_prospects,
-            "total_outreach": total_outreach,
-            "total_runs": total_runs,
-            "by_source": by_source,
-            "by_category": by_category,
-            "score_distribution": score_dist,
-        }
+        """),
+        _fetchall("""
+            SELECT signal, COUNT(*) as count
+            FROM prospect_signals GROUP BY signal ORDER BY count DESC
+        """),
+    )
+
+    return {
+        **totals,
+        "by_source": by_source,
+        "by_category": by_category,
+        "score_distribution": score_dist,
+        "by_signal": by_signal,
+    }
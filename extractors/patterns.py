@@ -35,6 +35,23 @@ REACHABILITY_SIGNALS = {
     "build_in_public": 0.3,
 }
 
+RELEVANCE_CATEGORIES = {
+    "Self-Taught Developer": 0.9,
+    "Career Changer": 0.85,
+    "Bootcamp Graduate": 0.8,
+    "Build in Public": 0.9,
+    "AI/Prompt Engineer": 0.95,
+    "100DaysOfCode": 0.85,
+    "Recently Laid Off": 0.7,
+    "Freelancer": 0.75,
+    "Junior Developer": 0.7,
+    "Job Seeker": 0.65,
+    "Senior Developer": 0.5,
+    "OSS Contributor": 0.7,
+    "Developer": 0.5,
+    "Startup Hiring": 0.6,
+}
+
 # Gaming influence signals — used for openarcade campaign
 # Repurposes trust_gap_score field as an "influence score"
 GAMING_INFLUENCE_SIGNALS = {
@@ -86,77 +103,60 @@ GAMING_RELEVANCE_CATEGORIES = {
 }
 
 
+def _pair_table(trust: dict, reach: dict, trust_default: float) -> dict:
+    """signal -> (trust/influence weight, reachability weight), merged so each
+    signal is looked up once per prospect instead of once per score."""
+    return {s: (trust.get(s, trust_default), reach.get(s, 0.0)) for s in {*trust, *reach}}
+
+
+# Per-campaign scoring parameters for _score_batch:
+# (signal pairs, default pair, trust divisor, raw_data link bonuses, relevance table)
+_MEMEX_SCORING = (
+    _pair_table(TRUST_GAP_SIGNALS, REACHABILITY_SIGNALS, 0.1),
+    (0.1, 0.0),
+    3.0,
+    (("github_url", 0.3), ("linkedin_url", 0.3), ("website_url", 0.2)),
+    RELEVANCE_CATEGORIES,
+)
+# Gaming repurposes trust_gap_score as an influence score
+_GAMING_SCORING = (
+    _pair_table(GAMING_INFLUENCE_SIGNALS, GAMING_REACHABILITY_SIGNALS, 0.05),
+    (0.05, 0.0),
+    2.5,
+    (("story_url", 0.2), ("contact_role", 0.4)),
+    GAMING_RELEVANCE_CATEGORIES,
+)
+
+
+def _score_batch(prospects: list[Prospect], scoring: tuple):
+    """Write all three scores for a batch in one flat loop.
+
+    Table lookups (including each dict's .get) are bound to locals up front,
+    so the inner loop does no global, attribute or method lookups.
+    """
+    pairs, default, trust_divisor, link_bonuses, relevance = scoring
+    weights = pairs.get
+    category_relevance = relevance.get
+    for p in prospects:
+        trust = reach = 0.0
+        for signal in p.signals:
+            t, r = weights(signal, default)
+            trust += t
+            reach += r
+        raw = p.raw_data
+        for key, bonus in link_bonuses:
+            if raw.get(key):
+                reach += bonus
+        # Same as min(x / d, 1.0) without the builtin call; halving is exact
+        # as a multiply, unlike 1/3 or 1/2.5, so only that divisor is replaced
+        p.trust_gap_score = trust / trust_divisor if trust < trust_divisor else 1.0
+        p.reachability_score = reach * 0.5 if reach < 2.0 else 1.0
+        p.relevance_score = category_relevance(p.category, 0.5)
+
+
 class PatternExtractor:
     """Extract and enrich signals from prospects."""
 
     def extract(self, prospects: list[Prospect], campaign: str = "memex") -> list[Prospect]:
-        for p in prospects:
-            if campaign == "openarcade":
-                p.trust_gap_score = self._score_gaming_influence(p)
-                p.reachability_score = self._score_gaming_reachability(p)
-                p.relevance_score = self._score_gaming_relevance(p)
-            else:
-                p.trust_gap_score = self._score_trust_gap(p)
-                p.reachability_score = self._score_reachability(p)
-                p.relevance_score = self._score_relevance(p)
+        _score_batch(prospects, _GAMING_SCORING if campaign == "openarcade" else _MEMEX_SCORING)
         return prospects
-
-    def _score_trust_gap(self, p: Prospect) -> float:
-        score = 0.0
-        for signal in p.signals:
-            score += TRUST_GAP_SIGNALS.get(signal, 0.1)
-        return min(score / 3.0, 1.0)
-
-    def _score_reachability(self, p: Prospect) -> float:
-        score = 0.0
-        for signal in p.signals:
-            score += REACHABILITY_SIGNALS.get(signal, 0.0)
-        if p.raw_data.get("github_url"):
-            score += 0.3
-        if p.raw_data.get("linkedin_url"):
-            score += 0.3
-        if p.raw_data.get("website_url"):
-            score += 0.2
-        return min(score / 2.0, 1.0)
-
-    def _score_relevance(self, p: Prospect) -> float:
-        """How relevant is screen history for this person specifically."""
-        high_relevance_categories = {
-            "Self-Taught Developer": 0.9,
-            "Career Changer": 0.85,
-            "Bootcamp Graduate": 0.8,
-            "Build in Public": 0.9,
-            "AI/Prompt Engineer": 0.95,
-            "100DaysOfCode": 0.85,
-            "Recently Laid Off": 0.7,
-            "Freelancer": 0.75,
-            "Junior Developer": 0.7,
-            "Job Seeker": 0.65,
-            "Senior Developer": 0.5,
-            "OSS Contributor": 0.7,
-            "Developer": 0.5,
-            "Startup Hiring": 0.6,
-        }
-        return high_relevance_categories.get(p.category, 0.5)
-
-    # --- Gaming campaign scoring ---
-
-    def _score_gaming_influence(self, p: Prospect) -> float:
-        """Influence score for gaming campaign (stored in trust_gap_score field)."""
-        score = 0.0
-        for signal in p.signals:
-            score += GAMING_INFLUENCE_SIGNALS.get(signal, 0.05)
-        return min(score / 2.5, 1.0)
-
-    def _score_gaming_reachability(self, p: Prospect) -> float:
-        score = 0.0
-        for signal in p.signals:
-            score += GAMING_REACHABILITY_SIGNALS.get(signal, 0.0)
-        if p.raw_data.get("story_url"):
-            score += 0.2
-        if p.raw_data.get("contact_role"):
-            score += 0.4
-        return min(score / 2.0, 1.0)
-
-    def _score_gaming_relevance(self, p: Prospect) -> float:
-        return GAMING_RELEVANCE_CATEGORIES.get(p.category, 0.5)
@@ -2,13 +2,15 @@
 """Prospector MCP Server — exposes Prospector's pipeline as MCP tools."""
 
 import asyncio
-import json
 import logging
 import os
 import sys
+import time
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
 
 import httpx
+import orjson
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -31,218 +33,363 @@ logger = logging.getLogger(__name__)
 server = Server("prospector")
 
 
+# One keep-alive client for every tool call instead of a new pool per request
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        # Compress over real networks; on loopback gzip only costs CPU both ends
+        local = urlsplit(PROSPECTOR_URL).hostname in ("localhost", "127.0.0.1", "::1")
+        _client = httpx.AsyncClient(
+            base_url=PROSPECTOR_URL,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            headers={"Accept-Encoding": "identity" if local else "gzip"},
+        )
+    return _client
+
+
+class RawJSON(str):
+    """A backend JSON body that call_tool passes through without re-encoding."""
+
+
+async def _fetch(path: str, params: dict, raw: bool) -> Any:
+    resp = await _get_client().get(path, params=params or None)
+    resp.raise_for_status()
+    return RawJSON(resp.text) if raw else orjson.loads(resp.content)
+
+
+# (path, params, raw) -> in-flight GET, so concurrent identical calls (e.g. an
+# agent burst-polling get-run-status) share one backend request
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+
+async def _coalesced_get(path: str, params: dict, raw: bool) -> Any:
+    key = (path, tuple(sorted(params.items())), raw)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(path, params, raw))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller being cancelled doesn't cancel the shared request
+    return await asyncio.shield(task)
+
+
 async def http_get(path: str, **params) -> Any:
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.get(f"{PROSPECTOR_URL}{path}", params=params or None)
-        resp.raise_for_status()
-        return resp.json()
+    return await _coalesced_get(path, params, raw=False)
+
+
+async def http_get_raw(path: str, **params) -> RawJSON:
+    """GET for tools that return the backend's JSON unchanged: no decode here
+    and no re-encode in call_tool."""
+    return await _coalesced_get(path, params, raw=True)
+
+
+# path -> (fetched_at, body) for slow-changing GETs; see http_get_cached
+_cache: Dict[str, tuple] = {}
+
+STATS_TTL = 5.0
+ADAPTERS_TTL = 60.0
+
+
+async def http_get_cached(path: str, ttl: float) -> RawJSON:
+    """http_get_raw, reusing a body fetched for the same path within ttl seconds."""
+    hit = _cache.get(path)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    result = await http_get_raw(path)
+    _cache[path] = (time.monotonic(), result)
+    return result
 
 
 async def http_post(path: str, body: dict = None) -> Any:
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.post(f"{PROSPECTOR_URL}{path}", json=body or {})
-        resp.raise_for_status()
-        return resp.json()
+    resp = await _get_client().post(path, json=body or {})
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    return [
-        Tool(
-            name="trigger-pipeline",
-            description=(
-                "Start a Prospector pipeline run. Fetches candidates from the specified "
-                "adapters (github, hackernews, twitter, bootcamps), scores them, and saves "
-                "results. Returns run_id immediately — poll get-run-status to check completion."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "adapters": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Adapter keys to run (e.g. ['github', 'hackernews']). Omit to run all.",
-                    },
-                    "adapter_configs": {
-                        "type": "object",
-                        "description": "Per-adapter config overrides (e.g. {'github': {'max_pages': 2}}).",
-                    },
-                    "weights": {
-                        "type": "object",
-                        "description": "Scoring weight overrides (e.g. {'trust_gap': 0.5, 'reachability': 0.3}).",
-                    },
-                    "campaign": {
-                        "type": "string",
-                        "enum": ["memex", "openarcade"],
-                        "description": "Campaign to run. 'memex' (default) finds developers for Memex outreach. 'openarcade' finds gaming enthusiasts, influencers, and platforms for OpenArcade promotion.",
-                    },
-                },
-                "additionalProperties": False,
-            },
+# Static tool schemas, built (and validated by pydantic) once at import
+_TOOLS = [
+    Tool(
+        name="trigger-pipeline",
+        description=(
+            "Start a Prospector pipeline run. Fetches candidates from the specified "
+            "adapters (github, hackernews, twitter, bootcamps), scores them, and saves "
+            "results. Returns run_id immediately — poll get-run-status to check completion."
         ),
-        Tool(
-            name="get-run-status",
-            description="Get the status and metadata for a specific pipeline run. Status is 'running' or 'done'.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "run_id": {
-                        "type": "string",
-                        "description": "The run ID returned by trigger-pipeline.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "adapters": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Adapter keys to run (e.g. ['github', 'hackernews']). Omit to run all.",
+                },
+                "adapter_configs": {
+                    "type": "object",
+                    "description": "Per-adapter config overrides (e.g. {'github': {'max_pages': 2}}).",
+                },
+                "weights": {
+                    "type": "object",
+                    "description": "Scoring weight overrides (e.g. {'trust_gap': 0.5, 'reachability': 0.3}).",
+                },
+                "campaign": {
+                    "type": "string",
+                    "enum": ["memex", "openarcade"],
+                    "description": "Campaign to run. 'memex' (default) finds developers for Memex outreach. 'openarcade' finds gaming enthusiasts, influencers, and platforms for OpenArcade promotion.",
                 },
-                "required": ["run_id"],
-                "additionalProperties": False,
-            },
-        ),
-        Tool(
-            name="list-runs",
-            description="List all pipeline runs with their status, timestamps, and prospect counts.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
             },
-        ),
-        Tool(
-            name="get-prospects",
-            description=(
-                "Get all prospects across runs, deduped by source+username (highest score wins). "
-                "Supports filtering by source, category, minimum score, and limit."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "description": "Filter by source (e.g. 'github', 'hackernews', 'twitter', 'bootcamp').",
-                    },
-                    "category": {
-                        "type": "string",
-                        "description": "Filter by category (e.g. 'developer', 'founder').",
-                    },
-                    "min_score": {
-                        "type": "number",
-                        "description": "Minimum final_score threshold (0.0–1.0).",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of prospects to return (default: 50).",
-                        "default": 50,
-                    },
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get-run-status",
+        description="Get the status and metadata for a specific pipeline run. Status is 'queued' (waiting for a free run slot), 'running' or 'done'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "run_id": {
+                    "type": "string",
+                    "description": "The run ID returned by trigger-pipeline.",
                 },
-                "additionalProperties": False,
             },
+            "required": ["run_id"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="list-runs",
+        description="List all pipeline runs with their status, timestamps, and prospect counts.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get-prospects",
+        description=(
+            "Get all prospects across runs, deduped by source+username (highest score wins). "
+            "Supports filtering by source, category, minimum score, and limit/offset paging."
         ),
-        Tool(
-            name="get-run-prospects",
-            description="Get all prospects from a specific pipeline run, sorted by score descending.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "run_id": {
-                        "type": "string",
-                        "description": "The run ID to fetch prospects for.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source": {
+                    "type": "string",
+                    "description": "Filter by source (e.g. 'github', 'hackernews', 'twitter', 'bootcamp').",
+                },
+                "category": {
+                    "type": "string",
+                    "description": "Filter by category (e.g. 'developer', 'founder').",
+                },
+                "min_score": {
+                    "type": "number",
+                    "description": "Minimum final_score threshold (0.0–1.0).",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of prospects to return (default: 50).",
+                    "default": 50,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of matching prospects to skip, for paging through results.",
                 },
-                "required": ["run_id"],
-                "additionalProperties": False,
             },
-        ),
-        Tool(
-            name="generate-outreach",
-            description="Generate a personalized outreach message for a prospect using Claude.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "prospect_id": {
-                        "type": "integer",
-                        "description": "The prospect's database ID (from get-prospects or get-run-prospects).",
-                    },
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get-run-prospects",
+        description="Get all prospects from a specific pipeline run, sorted by score descending.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "run_id": {
+                    "type": "string",
+                    "description": "The run ID to fetch prospects for.",
                 },
-                "required": ["prospect_id"],
-                "additionalProperties": False,
             },
-        ),
-        Tool(
-            name="get-stats",
-            description=(
-                "Get Prospector pipeline statistics: PVA metrics (position/velocity/acceleration), "
-                "source and category breakdowns, score distribution, and daily counts."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
+            "required": ["run_id"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="generate-outreach",
+        description="Generate a personalized outreach message for a prospect using Claude.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "prospect_id": {
+                    "type": "integer",
+                    "description": "The prospect's database ID (from get-prospects or get-run-prospects).",
+                },
             },
+            "required": ["prospect_id"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="generate-outreach-batch",
+        description=(
+            "Generate personalized outreach messages for several prospects at once. "
+            "Returns one result per prospect_id, in order; failures are reported per prospect."
         ),
-        Tool(
-            name="list-adapters",
-            description="List available data source adapters (github, hackernews, twitter, bootcamps) and their config schemas.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "prospect_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Prospect database IDs (from get-prospects or get-run-prospects).",
+                },
             },
+            "required": ["prospect_ids"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get-stats",
+        description=(
+            "Get Prospector pipeline statistics: PVA metrics (position/velocity/acceleration), "
+            "source and category breakdowns, score distribution, and daily counts."
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="list-adapters",
+        description="List available data source adapters (github, hackernews, twitter, bootcamps) and their config schemas.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    return _TOOLS
+
+
+def _dumps(obj: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> list:
     try:
         result = await _dispatch(name, arguments)
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        text = result if isinstance(result, RawJSON) else _dumps(result)
+        return [TextContent(type="text", text=text)]
     except Exception as e:
         logger.error(f"Tool {name} error: {e}")
-        return [TextContent(type="text", text=json.dumps({"error": str(e), "tool": name}, indent=2))]
+        return [TextContent(type="text", text=_dumps({"error": str(e), "tool": name}))]
+
+
+async def _trigger_pipeline(args: dict) -> Any:
+    body = {}
+    if args.get("adapters"):
+        body["adapters"] = args["adapters"]
+    if args.get("adapter_configs"):
+        body["adapter_configs"] = args["adapter_configs"]
+    if args.get("weights"):
+        body["weights"] = args["weights"]
+    if args.get("campaign"):
+        body["campaign"] = args["campaign"]
+    result = await http_post("/api/runs", body)
+    _cache.pop("/api/stats", None)  # a new run changes the stats
+    return result
+
+
+async def _get_run_status(args: dict) -> Any:
+    return await http_get_raw(f"/api/runs/{args['run_id']}/status")
+
+
+async def _list_runs(args: dict) -> Any:
+    return await http_get_raw("/api/runs")
+
+
+async def _get_prospects(args: dict) -> Any:
+    # Filtered and limited server-side, so only the selected rows come back
+    params = {"limit": args.get("limit", 50)}
+    if args.get("source"):
+        params["source"] = args["source"]
+    if args.get("category"):
+        params["category"] = args["category"]
+    if args.get("min_score") is not None:
+        params["min_score"] = args["min_score"]
+    if args.get("offset"):
+        params["offset"] = args["offset"]
+    return await http_get_raw("/api/prospects", **params)
+
+
+async def _get_run_prospects(args: dict) -> Any:
+    data = await http_get(f"/api/runs/{args['run_id']}")
+    return data.get("prospects", data)
+
+
+async def _generate_outreach(args: dict) -> Any:
+    result = await http_post(f"/api/prospects/{args['prospect_id']}/outreach")
+    _cache.pop("/api/stats", None)  # outreach counts are part of the stats
+    return result
+
+
+# Outreach generation calls the LLM backend; cap how many run at once
+MAX_CONCURRENT_OUTREACH = 8
+
+
+async def _generate_outreach_batch(args: dict) -> Any:
+    sem = asyncio.Semaphore(MAX_CONCURRENT_OUTREACH)
+
+    async def one(prospect_id: int) -> dict:
+        async with sem:
+            try:
+                result = await http_post(f"/api/prospects/{prospect_id}/outreach")
+            except Exception as e:
+                return {"prospect_id": prospect_id, "error": str(e)}
+        return {"prospect_id": prospect_id, **result}
+
+    results = await asyncio.gather(*(one(pid) for pid in args["prospect_ids"]))
+    _cache.pop("/api/stats", None)  # outreach counts are part of the stats
+    return results
+
+
+async def _get_stats(args: dict) -> Any:
+    return await http_get_cached("/api/stats", STATS_TTL)
+
+
+async def _list_adapters(args: dict) -> Any:
+    return await http_get_cached("/api/adapters", ADAPTERS_TTL)
+
+
+# Tool name -> handler; one dict lookup per call instead of an if/elif chain
+_HANDLERS = {
+    "trigger-pipeline": _trigger_pipeline,
+    "get-run-status": _get_run_status,
+    "list-runs": _list_runs,
+    "get-prospects": _get_prospects,
+    "get-run-prospects": _get_run_prospects,
+    "generate-outreach": _generate_outreach,
+    "generate-outreach-batch": _generate_outreach_batch,
+    "get-stats": _get_stats,
+    "list-adapters": _list_adapters,
+}
 
 
 async def _dispatch(name: str, args: dict) -> Any:
-    if name == "trigger-pipeline":
-        body = {}
-        if args.get("adapters"):
-            body["adapters"] = args["adapters"]
-        if args.get("adapter_configs"):
-            body["adapter_configs"] = args["adapter_configs"]
-        if args.get("weights"):
-            body["weights"] = args["weights"]
-        if args.get("campaign"):
-            body["campaign"] = args["campaign"]
-        return await http_post("/api/runs", body)
-
-    elif name == "get-run-status":
-        return await http_get(f"/api/runs/{args['run_id']}/status")
-
-    elif name == "list-runs":
-        return await http_get("/api/runs")
-
-    elif name == "get-prospects":
-        prospects = await http_get("/api/prospects")
-        if args.get("source"):
-            prospects = [p for p in prospects if p.get("source") == args["source"]]
-        if args.get("category"):
-            prospects = [p for p in prospects if p.get("category") == args["category"]]
-        if args.get("min_score") is not None:
-            prospects = [p for p in prospects if p.get("final_score", 0) >= args["min_score"]]
-        limit = args.get("limit", 50)
-        return prospects[:limit]
-
-    elif name == "get-run-prospects":
-        data = await http_get(f"/api/runs/{args['run_id']}")
-        return data.get("prospects", data)
-
-    elif name == "generate-outreach":
-        return await http_post(f"/api/prospects/{args['prospect_id']}/outreach")
-
-    elif name == "get-stats":
-        return await http_get("/api/stats")
-
-    elif name == "list-adapters":
-        return await http_get("/api/adapters")
-
-    else:
+    handler = _HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return await handler(args)
 
 
 async def main():
@@ -253,7 +400,11 @@ async def main():
             server_version="1.0.0",
             capabilities=ServerCapabilities(tools=ToolsCapability()),
         )
-        await server.run(read_stream, write_stream, init_options)
+        try:
+            await server.run(read_stream, write_stream, init_options)
+        finally:
+            if _client is not None:
+                await _client.aclose()
 
 
 if __name__ == "__main__":
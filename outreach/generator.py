@@ -1,55 +1,378 @@
+import asyncio
+import os
+import time
+from urllib.parse import urlencode
+
 import httpx
 import logging
+import orjson
+
+import db
+from adapters.client import (
+    MAX_RATE_LIMIT_WAIT, GitHubRateLimit, get_client, github_headers, github_request,
+)
+from adapters.github import GITHUB_GRAPHQL_URL
 
 logger = logging.getLogger(__name__)
 
 MEMEX_GITHUB = "https://github.com/joenewbry/memex"
 OPENARCADE_URL = "https://arcade.digitalsurfacelabs.com"
 
+# Lookups run on the app's shared pooled client but keep their own tighter timeout
+LOOKUP_TIMEOUT = 15
+
+# How long a looked-up response is reused (seconds), shared across campaigns and
+# re-runs via the http_cache table. Profiles share entries with the GitHub adapter.
+GITHUB_PROFILE_TTL = 3600
+GITHUB_REPOS_TTL = 1800
+GITHUB_EVENTS_TTL = 300
+HN_PROFILE_TTL = 3600
+# The merged result of all of a prospect's lookups, so a re-run within a day
+# makes no requests at all for people it has already researched
+DEEP_PROFILE_TTL = 86400
+# What each lookup adds to lookups_done when all of its requests succeed; the
+# merged profile is only cached once every scheduled lookup has
+GITHUB_LOOKUPS = ("github_profile", "github_repos", "github_activity")
+HN_LOOKUPS = ("hn_profile",)
+
+# Prospects researched at once by generate_batch. Each runs up to four lookups,
+# which keeps GitHub well under its secondary limit on concurrent requests.
+MAX_CONCURRENT_OUTREACH = 10
+
+# Rate-limited GitHub lookups are retried while the wait is short; a longer one
+# exhausts the shared limit until the reset, so other prospects skip GitHub
+# instead of each collecting a 403.
+GITHUB_API = "https://api.github.com/"
+GITHUB_MAX_RETRIES = 3
+# REST and GraphQL have separate quotas, so each has its own limit state
+_github_limit = GitHubRateLimit()
+_graphql_limit = GitHubRateLimit()
+
+
+class _TokenBucket:
+    """Paces requests to an hourly quota: bursts of up to `capacity`, then
+    `rate` per second. Synced down to the server's X-RateLimit-Remaining so
+    requests made elsewhere (the GitHub adapter shares the quota) count too."""
+
+    def __init__(self, per_hour: int, capacity: int):
+        self.rate = per_hour / 3600
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> bool:
+        """Take a token, waiting for one if it's due within MAX_RATE_LIMIT_WAIT.
+        Returns False (without waiting) if it isn't."""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.rate
+                if wait > MAX_RATE_LIMIT_WAIT:
+                    return False
+                await asyncio.sleep(wait)
+                self.tokens = 1.0
+                self.updated = time.monotonic()
+            self.tokens -= 1
+            return True
+
+    def sync(self, remaining: str | None):
+        if remaining and remaining.isdigit():
+            self.tokens = min(self.tokens, float(remaining))
+
+
+# GitHub's REST limits: 5000/hr with a token, 60/hr per IP without one.
+# GraphQL has its own points quota, so its requests don't use these.
+_github_buckets = {True: _TokenBucket(5000, 100), False: _TokenBucket(60, 60)}
+
+
+async def _cached_get(client: httpx.AsyncClient, url: str, ttl: float, params: dict = None,
+                      headers: dict = None):
+    """GET url and return the parsed JSON body, or None on a non-200 (or while
+    GitHub is rate limited).
+
+    200 responses are stored in http_cache; a copy younger than ttl is
+    returned without any request. An older one is revalidated with
+    If-None-Match / If-Modified-Since, and GitHub doesn't count the 304
+    against the rate limit.
+    """
+    key = f"{url}?{urlencode(params)}" if params else url
+    cached = await db.get_http_cache(key)
+    if cached and time.time() - (cached["fetched_at"] or 0) < ttl:
+        return orjson.loads(cached["body"])
+    headers = dict(headers or {})
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    if url.startswith(GITHUB_API):
+        resp = await github_request(
+            client, "GET", url, _github_limit, retries=GITHUB_MAX_RETRIES,
+            bucket=_github_buckets["Authorization" in headers],
+            params=params, headers=headers, timeout=LOOKUP_TIMEOUT,
+        )
+    else:
+        resp = await client.get(url, params=params, headers=headers, timeout=LOOKUP_TIMEOUT)
+    if resp is None:
+        return None
+    if resp.status_code == 304 and cached:
+        await db.touch_http_cache(key)
+        return orjson.loads(cached["body"])
+    if resp.status_code != 200:
+        return None
+    await db.save_http_cache(key, resp.text, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+    return orjson.loads(resp.content)
+
+
+# With a token, profile and top repos come from one GraphQL query instead of two
+# REST calls. The public events feed has no GraphQL equivalent and stays on REST.
+_GRAPHQL_USER_LOOKUP = """
+query($login: String!) {
+  user(login: $login) {
+    name bio company location websiteUrl twitterUsername createdAt
+    followers { totalCount }
+    repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    topRepositories: repositories(first: 5, privacy: PUBLIC, ownerAffiliations: OWNER, isFork: false,
+                                  orderBy: {field: STARGAZERS, direction: DESC}) {
+      nodes { name description stargazerCount isFork primaryLanguage { name } }
+    }
+  }
+}
+"""
+
+
+async def _cached_graphql_user(client: httpx.AsyncClient, username: str) -> dict | None:
+    """The GraphQL user for username, or None if missing, failed or rate limited.
+
+    Cached in http_cache under a synthetic key for GITHUB_REPOS_TTL (the
+    shorter of the two REST TTLs it replaces).
+    """
+    key = f"{GITHUB_GRAPHQL_URL}#user={username}"
+    cached = await db.get_http_cache(key)
+    if cached and time.time() - (cached["fetched_at"] or 0) < GITHUB_REPOS_TTL:
+        return orjson.loads(cached["body"])
+    resp = await github_request(
+        client, "POST", GITHUB_GRAPHQL_URL, _graphql_limit, retries=GITHUB_MAX_RETRIES,
+        json={"query": _GRAPHQL_USER_LOOKUP, "variables": {"login": username}},
+        headers=github_headers(),
+        timeout=LOOKUP_TIMEOUT,
+    )
+    if resp is None or resp.status_code != 200:
+        return None
+    user = (orjson.loads(resp.content).get("data") or {}).get("user")
+    if user:
+        await db.save_http_cache(key, orjson.dumps(user).decode())
+    return user
+
+
+def _graphql_user_to_rest(user: dict | None) -> tuple[dict | None, list | None]:
+    """Split a GraphQL user into REST-shaped /users/{u} and /users/{u}/repos bodies."""
+    if not user:
+        return None, None
+    profile = {
+        "name": user.get("name"),
+        "bio": user.get("bio"),
+        "company": user.get("company"),
+        "location": user.get("location"),
+        "public_repos": (user.get("repositories") or {}).get("totalCount"),
+        "followers": (user.get("followers") or {}).get("totalCount"),
+        "blog": user.get("websiteUrl") or "",
+        "twitter_username": user.get("twitterUsername"),
+        "created_at": user.get("createdAt"),
+    }
+    repos = [
+        {
+            "name": node.get("name"),
+            "description": node.get("description"),
+            "stargazers_count": node.get("stargazerCount"),
+            "language": (node.get("primaryLanguage") or {}).get("name"),
+            "fork": node.get("isFork"),
+        }
+        for node in (user.get("topRepositories") or {}).get("nodes") or []
+    ]
+    return profile, repos
+
+
+# Bio substrings, checked in order against the lowercased bio
+_SENIOR_KEYWORDS = ("senior", "staff", "principal", "lead", "architect", "director", "vp ", "cto",
+                    "founder", "ex-faang", "10+ years", "8+ years")
+_HOOK_MARKERS = ("building", "working on", "created", "shipped", "launched")
+_GAME_REPO_KEYWORDS = ("game", "arcade", "retro", "pixel", "phaser")
+_GAMING_BIO_MARKERS = ("review", "stream", "play", "retro", "arcade", "classic", "pixel")
+
+
+# Category -> message copy, with the fallback used for unlisted categories
+_CATEGORY_RELEVANCE = {
+    "Self-Taught Developer": "For self-taught devs, it's the credential that doesn't exist yet — proof of what you actually build, every day.",
+    "Career Changer": "For career changers, it bridges the credibility gap — showing your learning velocity and real problem-solving instead of a missing CS degree.",
+    "Build in Public": "For builders in public, it's the difference between curated updates and a continuous, verifiable record of what you actually ship.",
+    "AI/Prompt Engineer": "For AI-native roles where there's no standard credential yet, it captures your actual workflow with LLMs as proof of expertise.",
+    "Bootcamp Graduate": "For bootcamp grads competing against CS degrees, it levels the field by showing how you actually think through problems.",
+    "Recently Laid Off": "It lets you carry a verifiable record of your engineering work between jobs — better than resume bullets or reference calls.",
+    "Freelancer": "For freelancers, it replaces the slow trust-building of reviews and portfolios with immediate proof of how you work.",
+    "OSS Contributor": "For maintainers, it captures the 90% of work that isn't in the commit log — triaging, debugging, code review, research.",
+    "Junior Developer": "For early-career devs, it's a way to stand out by showing your actual problem-solving process, not just finished projects.",
+    "Job Seeker": "It gives job seekers a verifiable record of what they actually do — stronger than any resume claim.",
+}
+_DEFAULT_RELEVANCE = "It creates a verifiable record of your actual work — stronger than any resume or portfolio."
+
+_SENIOR_QUESTIONS = {
+    "Senior Developer": "what would have convinced you to adopt something like this at a previous team?",
+    "Recently Laid Off": "when you think about proving your impact at your last role, what evidence do you wish you had?",
+    "Build in Public": "do you think verifiable screen history would make build-in-public more credible, or would it kill the curated narrative that works?",
+    "AI/Prompt Engineer": "how do you think AI-native roles should credential themselves when the field is moving this fast?",
+    "Freelancer": "what's the single biggest trust barrier you face with new clients, and would process transparency help or hurt?",
+    "OSS Contributor": "if sponsors could see your full maintenance effort (not just commits), would that change the funding conversation?",
+}
+_DEFAULT_SENIOR_QUESTION = "what's the biggest trust gap you see in how technical work gets evaluated today?"
+
+_STANDARD_QUESTIONS = {
+    "Self-Taught Developer": "Would a verifiable record of your daily coding help your job search, or do employers not care about process?",
+    "Career Changer": "When you're applying, what's the hardest part of proving you can actually build things?",
+    "Build in Public": "Would you share continuous screen history with your audience, or is the curated version more valuable?",
+    "AI/Prompt Engineer": "How do you currently prove your AI expertise to potential clients or employers?",
+    "Bootcamp Graduate": "What's been the biggest barrier in your job search — skills, credibility, or something else?",
+    "Recently Laid Off": "In your current search, what would help you stand out faster?",
+    "Freelancer": "What do you currently show new clients to build trust before they've worked with you?",
+    "OSS Contributor": "If you could show sponsors the full picture of your maintenance work, would it change things?",
+    "Junior Developer": "What's the hardest part of proving what you can do with limited professional experience?",
+    "Job Seeker": "What would make the biggest difference in your job search right now?",
+    "100DaysOfCode": "Would a verifiable record of your daily progress be useful beyond just the tweets?",
+}
+_DEFAULT_STANDARD_QUESTION = "Would a verifiable record of your actual work process be useful to you?"
+
+_GAMING_QUESTIONS = {
+    "Gaming YouTuber": "Would your audience be into a video showcasing 100+ free browser arcade games? I think it'd make great content.",
+    "Retro Gaming Streamer": "Would you be up for streaming some of these classics? I'd love to see your take on the retro collection.",
+    "Game Reviewer": "Would you be interested in reviewing the collection? I'd love honest feedback on the game selection.",
+    "Gaming Content Creator": "Would a feature on 100+ free browser arcade games fit your content? Happy to give you anything you need for a write-up.",
+    "Browser Game Enthusiast": "What classic games do you think are missing? I'm always looking to expand the collection.",
+    "Retro Enthusiast": "What classic arcade games do you think every collection needs? I want to make sure the essentials are covered.",
+    "Game Developer": "As a game dev, what would make you want to contribute a game to a free arcade collection like this?",
+    "Indie Game Dev": "Would you be interested in having one of your games featured in the arcade? Always looking for cool indie titles.",
+    "Game Jam Participant": "Would you want to submit any of your jam games to the arcade? Great way to get more eyes on them.",
+}
+_DEFAULT_GAMING_QUESTION = "What do you think — would you play these? I'd love your honest take."
+
 
 class OutreachGenerator:
     """Generates personalized outreach by doing a deep lookup on each person."""
 
-    async def generate(self, prospect: dict, campaign: str = "memex") -> tuple[str, dict]:
-        """Returns (message, deep_profile) after researching the person."""
-        deep = await self._deep_lookup(prospect)
+    async def generate(self, prospect: dict, campaign: str = "memex",
+                       force_refresh: bool = False) -> tuple[str, dict]:
+        """Returns (message, deep_profile) after researching the person.
+
+        force_refresh skips the cached deep profile (per-endpoint lookup
+        caches still apply).
+        """
+        # Each campaign's partnership pitch ignores the deep profile, so skip the lookups
+        partnership_source = "gaming_platforms" if campaign == "openarcade" else "bootcamps"
+        if prospect.get("source") == partnership_source:
+            deep = {"lookups_done": [], "details": {}}
+            deep["is_senior"] = self._assess_seniority(prospect, deep)
+        else:
+            deep = await self._deep_lookup(prospect, force_refresh)
         if campaign == "openarcade":
             message = self._compose_openarcade(prospect, deep)
         else:
             message = self._compose(prospect, deep)
         return message, deep
 
-    async def _deep_lookup(self, p: dict) -> dict:
-        """Fetch additional info about the person from their public profiles."""
-        deep = {"lookups_done": [], "details": {}}
+    async def generate_batch(self, prospects: list[dict], campaign: str = "memex") -> list:
+        """generate() for many prospects concurrently, at most MAX_CONCURRENT_OUTREACH
+        at a time. Returns one (message, deep_profile) or exception per prospect, in order."""
+        sem = asyncio.Semaphore(MAX_CONCURRENT_OUTREACH)
+
+        async def one(prospect: dict) -> tuple[str, dict]:
+            async with sem:
+                return await self.generate(prospect, campaign=campaign)
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            # GitHub deep lookup
-            if p["source"] == "github" or (p.get("raw_data") or {}).get("github_url"):
-                username = p["username"] if p["source"] == "github" else None
-                github_url = (p.get("raw_data") or {}).get("github_url", "")
-                if not username and github_url:
-                    username = github_url.rstrip("/").split("/")[-1]
-                if username:
-                    deep = await self._lookup_github(client, username, deep)
+        return await asyncio.gather(*(one(p) for p in prospects), return_exceptions=True)
 
-            # HN deep lookup
-            if p["source"] == "hackernews":
-                deep = await self._lookup_hn(client, p["username"], deep)
+    async def _deep_lookup(self, p: dict, force_refresh: bool = False) -> dict:
+        """Fetch additional info about the person from their public profiles."""
+        cache_key = f"deep-profile:{p['source']}/{p['username']}"
+        cached = None if force_refresh else await db.get_http_cache(cache_key)
+        if cached and time.time() - (cached["fetched_at"] or 0) < DEEP_PROFILE_TTL:
+            deep = orjson.loads(cached["body"])
+            deep["is_senior"] = self._assess_seniority(p, deep)
+            return deep
+
+        deep = {"lookups_done": [], "details": {}}
+        client = get_client()
+        lookups = []
+        expected = set()
+        # GitHub deep lookup
+        if p["source"] == "github" or (p.get("raw_data") or {}).get("github_url"):
+            username = p["username"] if p["source"] == "github" else None
+            github_url = (p.get("raw_data") or {}).get("github_url", "")
+            if not username and github_url:
+                username = github_url.rstrip("/").split("/")[-1]
+            if username:
+                lookups.append(self._lookup_github(client, username, {"lookups_done": [], "details": {}}))
+                expected.update(GITHUB_LOOKUPS)
+
+        # HN deep lookup
+        if p["source"] == "hackernews":
+            lookups.append(self._lookup_hn(client, p["username"], {"lookups_done": [], "details": {}}))
+            expected.update(HN_LOOKUPS)
+
+        # Run concurrently, each into its own dict, then merge in a fixed order
+        # so lookups_done and details come out the same as a sequential run
+        for part in await asyncio.gather(*lookups):
+            deep["lookups_done"].extend(part["lookups_done"])
+            deep["details"].update(part["details"])
+        # Only cache a complete profile: if any part was rate limited or failed
+        # (say, the events feed while GitHub is exhausted), the whole lookup is
+        # retried next time instead of serving the partial profile for a day.
+        # The parts that did succeed are still in http_cache under their own TTLs.
+        if (expected and expected.issubset(deep["lookups_done"])
+                and not _github_limit.exhausted and not _graphql_limit.exhausted):
+            await db.save_http_cache(cache_key, orjson.dumps(deep).decode())
 
         # Determine seniority
         deep["is_senior"] = self._assess_seniority(p, deep)
         return deep
 
     async def _lookup_github(self, client: httpx.AsyncClient, username: str, deep: dict) -> dict:
+        base = f"https://api.github.com/users/{username}"
+        # Token-aware, so with GITHUB_TOKEN set the REST calls share the 5000/hr
+        # authenticated quota with the GraphQL lookup instead of the 60/hr one
+        headers = github_headers()
+        events_get = _cached_get(
+            client,
+            f"{base}/events/public",
+            GITHUB_EVENTS_TTL,
+            params={"per_page": 10},
+            headers=headers,
+        )
+        # Profile, top repos and recent activity are independent: one round trip, not three
+        if os.environ.get("GITHUB_TOKEN"):
+            user, events = await asyncio.gather(
+                _cached_graphql_user(client, username), events_get, return_exceptions=True,
+            )
+            profile, repos = (user, user) if isinstance(user, Exception) else _graphql_user_to_rest(user)
+        else:
+            profile, repos, events = await asyncio.gather(
+                _cached_get(client, base, GITHUB_PROFILE_TTL, headers=headers),
+                _cached_get(
+                    client,
+                    f"{base}/repos",
+                    GITHUB_REPOS_TTL,
+                    params={"sort": "stars", "per_page": 5},
+                    headers=headers,
+                ),
+                events_get,
+                return_exceptions=True,
+            )
         try:
             # Profile
-            resp = await client.get(
-                f"https://api.github.com/users/{username}",
-                headers={"Accept": "application/vnd.github.v3+json"},
-            )
-            if resp.status_code == 200:
-                profile = resp.json()
+            if isinstance(profile, Exception):
+                raise profile
+            if profile is not None:
                 deep["details"]["github"] = {
                     "name": profile.get("name"),
                     "bio": profile.get("bio"),
@@ -64,13 +387,9 @@ class OutreachGenerator:
                 deep["lookups_done"].append("github_profile")
 
             # Top repos
-            resp = await client.get(
-                f"https://api.github.com/users/{username}/repos",
-                params={"sort": "stars", "per_page": 5},
-                headers={"Accept": "application/vnd.github.v3+json"},
-            )
-            if resp.status_code == 200:
-                repos = resp.json()
+            if isinstance(repos, Exception):
+                raise repos
+            if repos is not None:
                 deep["details"]["top_repos"] = [
                     {
                         "name": r.get("name"),
@@ -84,15 +403,16 @@ class OutreachGenerator:
                 deep["lookups_done"].append("github_repos")
 
             # Recent activity
-            resp = await client.get(
-                f"https://api.github.com/users/{username}/events/public",
-                params={"per_page": 10},
-                headers={"Accept": "application/vnd.github.v3+json"},
-            )
-            if resp.status_code == 200:
-                events = resp.json()
-                event_types = [e.get("type") for e in events[:10]]
-                recent_repos = list({e.get("repo", {}).get("name", "") for e in events[:10]})
+            if isinstance(events, Exception):
+                raise events
+            if events is not None:
+                # One pass over the (already orjson-parsed) events for both fields
+                event_types = []
+                active = set()
+                for e in events[:10]:
+                    event_types.append(e.get("type"))
+                    active.add(e.get("repo", {}).get("name", ""))
+                recent_repos = list(active)
                 deep["details"]["recent_activity"] = {
                     "event_types": event_types,
                     "active_repos": recent_repos[:5],
@@ -104,17 +424,17 @@ class OutreachGenerator:
 
     async def _lookup_hn(self, client: httpx.AsyncClient, username: str, deep: dict) -> dict:
         try:
-            resp = await client.get(f"https://hacker-news.firebaseio.com/v0/user/{username}.json")
-            if resp.status_code == 200:
-                user = resp.json()
-                if user:
-                    deep["details"]["hn"] = {
-                        "karma": user.get("karma"),
-                        "about": user.get("about", ""),
-                        "created": user.get("created"),
-                        "submitted_count": len(user.get("submitted", [])),
-                    }
-                    deep["lookups_done"].append("hn_profile")
+            user = await _cached_get(
+                client, f"https://hacker-news.firebaseio.com/v0/user/{username}.json", HN_PROFILE_TTL,
+            )
+            if user:
+                deep["details"]["hn"] = {
+                    "karma": user.get("karma"),
+                    "about": user.get("about", ""),
+                    "created": user.get("created"),
+                    "submitted_count": len(user.get("submitted", [])),
+                }
+                deep["lookups_done"].append("hn_profile")
         except Exception as e:
             logger.warning(f"HN lookup failed for {username}: {e}")
         return deep
@@ -134,7 +454,7 @@ class OutreachGenerator:
             if (hn.get("karma") or 0) > 5000:
                 return True
         bio = (p.get("bio") or "").lower()
-        for kw in ["senior", "staff", "principal", "lead", "architect", "director", "vp ", "cto", "founder", "ex-faang", "10+ years", "8+ years"]:
+        for kw in _SENIOR_KEYWORDS:
             if kw in bio:
                 return True
         return False
@@ -204,9 +524,10 @@ class OutreachGenerator:
         bio = p.get("bio", "")
         if bio and len(bio) > 20:
             # Pick something specific from the bio
-            for marker in ["building", "working on", "created", "shipped", "launched"]:
-                if marker in bio.lower():
-                    idx = bio.lower().index(marker)
+            bio_lower = bio.lower()
+            for marker in _HOOK_MARKERS:
+                idx = bio_lower.find(marker)
+                if idx != -1:
                     snippet = bio[idx:idx+80].split(".")[0].split(",")[0]
                     return f"saw that you're {snippet.lower()}" if not snippet[0].isupper() else f"saw that you're {snippet[0].lower()}{snippet[1:]}"
 
@@ -253,46 +574,13 @@ I'm building Memex ({MEMEX_GITHUB}) — continuous screen history as a verifiabl
 — Joe"""
 
     def _category_relevance(self, category: str) -> str:
-        mapping = {
-            "Self-Taught Developer": "For self-taught devs, it's the credential that doesn't exist yet — proof of what you actually build, every day.",
-            "Career Changer": "For career changers, it bridges the credibility gap — showing your learning velocity and real problem-solving instead of a missing CS degree.",
-            "Build in Public": "For builders in public, it's the difference between curated updates and a continuous, verifiable record of what you actually ship.",
-            "AI/Prompt Engineer": "For AI-native roles where there's no standard credential yet, it captures your actual workflow with LLMs as proof of expertise.",
-            "Bootcamp Graduate": "For bootcamp grads competing against CS degrees, it levels the field by showing how you actually think through problems.",
-            "Recently Laid Off": "It lets you carry a verifiable record of your engineering work between jobs — better than resume bullets or reference calls.",
-            "Freelancer": "For freelancers, it replaces the slow trust-building of reviews and portfolios with immediate proof of how you work.",
-            "OSS Contributor": "For maintainers, it captures the 90% of work that isn't in the commit log — triaging, debugging, code review, research.",
-            "Junior Developer": "For early-career devs, it's a way to stand out by showing your actual problem-solving process, not just finished projects.",
-            "Job Seeker": "It gives job seekers a verifiable record of what they actually do — stronger than any resume claim.",
-        }
-        return mapping.get(category, "It creates a verifiable record of your actual work — stronger than any resume or portfolio.")
+        return _CATEGORY_RELEVANCE.get(category, _DEFAULT_RELEVANCE)
 
     def _pick_question_senior(self, category: str, p: dict) -> str:
-        mapping = {
-            "Senior Developer": "what would have convinced you to adopt something like this at a previous team?",
-            "Recently Laid Off": "when you think about proving your impact at your last role, what evidence do you wish you had?",
-            "Build in Public": "do you think verifiable screen history would make build-in-public more credible, or would it kill the curated narrative that works?",
-            "AI/Prompt Engineer": "how do you think AI-native roles should credential themselves when the field is moving this fast?",
-            "Freelancer": "what's the single biggest trust barrier you face with new clients, and would process transparency help or hurt?",
-            "OSS Contributor": "if sponsors could see your full maintenance effort (not just commits), would that change the funding conversation?",
-        }
-        return mapping.get(category, "what's the biggest trust gap you see in how technical work gets evaluated today?")
+        return _SENIOR_QUESTIONS.get(category, _DEFAULT_SENIOR_QUESTION)
 
     def _pick_question_standard(self, category: str, p: dict) -> str:
-        mapping = {
-            "Self-Taught Developer": "Would a verifiable record of your daily coding help your job search, or do employers not care about process?",
-            "Career Changer": "When you're applying, what's the hardest part of proving you can actually build things?",
-            "Build in Public": "Would you share continuous screen history with your audience, or is the curated version more valuable?",
-            "AI/Prompt Engineer": "How do you currently prove your AI expertise to potential clients or employers?",
-            "Bootcamp Graduate": "What's been the biggest barrier in your job search — skills, credibility, or something else?",
-            "Recently Laid Off": "In your current search, what would help you stand out faster?",
-            "Freelancer": "What do you currently show new clients to build trust before they've worked with you?",
-            "OSS Contributor": "If you could show sponsors the full picture of your maintenance work, would it change things?",
-            "Junior Developer": "What's the hardest part of proving what you can do with limited professional experience?",
-            "Job Seeker": "What would make the biggest difference in your job search right now?",
-            "100DaysOfCode": "Would a verifiable record of your daily progress be useful beyond just the tweets?",
-        }
-        return mapping.get(category, "Would a verifiable record of your actual work process be useful to you?")
+        return _STANDARD_QUESTIONS.get(category, _DEFAULT_STANDARD_QUESTION)
 
     def _compose_bootcamp(self, p: dict) -> str:
         raw = p.get("raw_data", {})
@@ -389,8 +677,13 @@ Would you be open to featuring it or adding it to your directory?
 
         # Check for starred repos
         top_repos = details.get("top_repos", [])
-        game_repos = [r for r in top_repos if any(kw in (r.get("name") or "").lower() or (r.get("description") or "").lower()
-                       for kw in ["game", "arcade", "retro", "pixel", "phaser"])]
+        game_repos = []
+        for r in top_repos:
+            # Lowercased once per repo rather than once per keyword
+            name = (r.get("name") or "").lower()
+            description = (r.get("description") or "").lower()
+            if any(kw in name or kw in description for kw in _GAME_REPO_KEYWORDS):
+                game_repos.append(r)
         if game_repos:
             best = game_repos[0]
             desc = f" ({best['description']})" if best.get("description") else ""
@@ -403,22 +696,12 @@ Would you be open to featuring it or adding it to your directory?
 
         # Bio details
         if bio and len(bio) > 20:
-            for marker in ["review", "stream", "play", "retro", "arcade", "classic", "pixel"]:
-                if marker in bio.lower():
+            bio_lower = bio.lower()
+            for marker in _GAMING_BIO_MARKERS:
+                if marker in bio_lower:
                     return f"Love that you're into {marker} gaming"
 
         return ""
 
     def _gaming_question(self, category: str) -> str:
-        mapping = {
-            "Gaming YouTuber": "Would your audience be into a video showcasing 100+ free browser arcade games? I think it'd make great content.",
-            "Retro Gaming Streamer": "Would you be up for streaming some of these classics? I'd love to see your take on the retro collection.",
-            "Game Reviewer": "Would you be interested in reviewing the collection? I'd love honest feedback on the game selection.",
-            "Gaming Content Creator": "Would a feature on 100+ free browser arcade games fit your content? Happy to give you anything you need for a write-up.",
-            "Browser Game Enthusiast": "What classic games do you think are missing? I'm always looking to expand the collection.",
-            "Retro Enthusiast": "What classic arcade games do you think every collection needs? I want to make sure the essentials are covered.",
-            "Game Developer": "As a game dev, what would make you want to contribute a game to a free arcade collection like this?",
-            "Indie Game Dev": "Would you be interested in having one of your games featured in the arcade? Always looking for cool indie titles.",
-            "Game Jam Participant": "Would you want to submit any of your jam games to the arcade? Great way to get more eyes on them.",
-        }
-        return mapping.get(category, "What do you think — would you play these? I'd love your honest take.")
+        return _GAMING_QUESTIONS.get(category, _DEFAULT_GAMING_QUESTION)
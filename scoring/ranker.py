@@ -1,3 +1,4 @@
+from operator import attrgetter
 from adapters.base import Prospect
 
 MEMEX_WEIGHTS = {
@@ -19,18 +20,26 @@ class Ranker:
     def __init__(self, weights: dict = None):
         self.weights = weights or MEMEX_WEIGHTS.copy()
 
-    def rank(self, prospects: list[Prospect], campaign: str = "memex") -> list[Prospect]:
+    def rank(self, prospects: list[Prospect], campaign: str = "memex",
+             weights: dict = None) -> list[Prospect]:
         # Use campaign-specific defaults if no custom weights were set
         if campaign == "openarcade" and self.weights == MEMEX_WEIGHTS:
-            weights = OPENARCADE_WEIGHTS
+            base = OPENARCADE_WEIGHTS
         else:
-            weights = self.weights
+            base = self.weights
+        # Per-run overrides are merged locally so concurrent runs never see
+        # each other's weights through the shared ranker
+        weights = {**base, **weights} if weights else base
 
+        # Weights read once per batch rather than three dict lookups per prospect
+        w_trust = weights["trust_gap"]
+        w_reach = weights["reachability"]
+        w_relevance = weights["relevance"]
         for p in prospects:
             p.final_score = (
-                p.trust_gap_score * weights["trust_gap"]
-                + p.reachability_score * weights["reachability"]
-                + p.relevance_score * weights["relevance"]
+                p.trust_gap_score * w_trust
+                + p.reachability_score * w_reach
+                + p.relevance_score * w_relevance
             )
-        prospects.sort(key=lambda p: p.final_score, reverse=True)
+        prospects.sort(key=attrgetter("final_score"), reverse=True)
         return prospects
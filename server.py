@@ -2,32 +2,65 @@
 """Prospector — Screen History Trust Beachhead Finder"""
 
 import asyncio
+import gzip
+import hashlib
 import json
+import os
 import time
+from itertools import chain, repeat
 from pathlib import Path
 from typing import Callable, Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, BackgroundTasks
+import orjson
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, BackgroundTasks
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from pydantic import BaseModel
 
-from adapters import ADAPTERS
+from adapters import ADAPTERS, fetch_each
+from adapters import http_cache
+from adapters.client import close_client
 from extractors import PatternExtractor
 from scoring import Ranker
 from outreach import OutreachGenerator
 import db
 
-app = FastAPI(title="Prospector")
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson instead of the stdlib json module.
+    (fastapi.responses.ORJSONResponse is deprecated in newer FastAPI.)"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+app = FastAPI(title="Prospector", default_response_class=ORJSONResponse)
+# Prospect lists are large, repetitive JSON; small responses go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 extractor = PatternExtractor()
 ranker = Ranker()
 outreach_gen = OutreachGenerator()
 
+# Runs beyond this many wait their turn (status "queued") instead of all
+# sharing the event loop, the adapters' rate limits and the DB writer at once
+MAX_CONCURRENT_RUNS = int(os.environ.get("PROSPECTOR_MAX_CONCURRENT_RUNS", "2"))
+_run_semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+
 
 @app.on_event("startup")
 async def startup():
     await db.init_db()
+    db.start_checkpoints()
+    # GitHub profile responses go in the http_cache table, shared with outreach lookups
+    http_cache.configure(db)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_client()
+    await db.close_db()
 
 
 async def _execute_pipeline(
@@ -37,47 +70,71 @@ async def _execute_pipeline(
     weight_overrides: dict,
     campaign: str = "memex",
     progress_cb: Optional[Callable] = None,
+) -> list:
+    """Run the pipeline once a run slot is free. The run is saved as "queued"
+    by the caller and marked "running" here when it starts."""
+    if progress_cb and _run_semaphore.locked():
+        await progress_cb({"type": "stage", "stage": "queued",
+                           "message": "Waiting for another run to finish..."})
+    async with _run_semaphore:
+        await db.set_run_status(run_id, "running")
+        return await _run_pipeline(run_id, enabled_adapters, adapter_configs,
+                                   weight_overrides, campaign, progress_cb)
+
+
+async def _run_pipeline(
+    run_id: str,
+    enabled_adapters: list,
+    adapter_configs: dict,
+    weight_overrides: dict,
+    campaign: str,
+    progress_cb: Optional[Callable],
 ) -> list:
     """Core pipeline: fetch, extract, rank, save. Returns saved prospects."""
-    if weight_overrides:
-        ranker.weights.update(weight_overrides)
-
     all_prospects = []
     log_entries = []
 
-    for adapter_key in enabled_adapters:
-        if adapter_key not in ADAPTERS:
-            continue
-        adapter = ADAPTERS[adapter_key]()
-        if progress_cb:
+    adapter_keys = [key for key in enabled_adapters if key in ADAPTERS]
+    if progress_cb:
+        for adapter_key in adapter_keys:
             await progress_cb({
                 "type": "adapter_started",
                 "adapter": adapter_key,
-                "message": f"Fetching from {adapter.name}...",
+                "message": f"Fetching from {ADAPTERS[adapter_key].name}...",
             })
-        try:
-            adapter_config = adapter_configs.get(adapter_key, {})
-            adapter_config["campaign"] = campaign
-            prospects = await adapter.fetch(adapter_config)
-            all_prospects.extend(prospects)
-            msg = f"{adapter.name}: found {len(prospects)} prospects"
-            log_entries.append(msg)
-            if progress_cb:
-                await progress_cb({
-                    "type": "adapter_done",
-                    "adapter": adapter_key,
-                    "count": len(prospects),
-                    "message": msg,
-                })
-        except Exception as e:
-            msg = f"{adapter.name}: error — {str(e)}"
-            log_entries.append(msg)
+
+    # Progress is reported as each adapter finishes; results are merged afterwards
+    # in adapter order so the run is the same whichever adapter is fastest
+    results = {}
+    messages = {}
+    async for adapter_key, result in fetch_each({
+        adapter_key: {**adapter_configs.get(adapter_key, {}), "campaign": campaign}
+        for adapter_key in adapter_keys
+    }):
+        adapter_name = ADAPTERS[adapter_key].name
+        results[adapter_key] = result
+        if isinstance(result, BaseException):
+            messages[adapter_key] = msg = f"{adapter_name}: error — {str(result)}"
             if progress_cb:
                 await progress_cb({
                     "type": "adapter_error",
                     "adapter": adapter_key,
                     "message": msg,
                 })
+            continue
+        messages[adapter_key] = msg = f"{adapter_name}: found {len(result)} prospects"
+        if progress_cb:
+            await progress_cb({
+                "type": "adapter_done",
+                "adapter": adapter_key,
+                "count": len(result),
+                "message": msg,
+            })
+
+    for adapter_key in adapter_keys:
+        log_entries.append(messages[adapter_key])
+        if not isinstance(results[adapter_key], BaseException):
+            all_prospects.extend(results[adapter_key])
 
     if progress_cb:
         await progress_cb({"type": "stage", "stage": "extracting", "message": "Extracting signals..."})
@@ -85,15 +142,14 @@ async def _execute_pipeline(
 
     if progress_cb:
         await progress_cb({"type": "stage", "stage": "ranking", "message": "Scoring and ranking..."})
-    all_prospects = ranker.rank(all_prospects, campaign=campaign)
+    all_prospects = ranker.rank(all_prospects, campaign=campaign, weights=weight_overrides)
 
     if progress_cb:
         await progress_cb({"type": "stage", "stage": "saving", "message": "Saving to database..."})
-    await db.save_prospects(run_id, all_prospects)
-    await db.save_run(run_id, "done", time.time(), time.time(),
-                      adapters_used=enabled_adapters, log=log_entries)
-
-    return await db.get_run_prospects(run_id)
+    saved = await db.finish_run(run_id, all_prospects, time.time(),
+                                adapters_used=enabled_adapters, log=log_entries)
+    _invalidate_stats()
+    return saved
 
 
 @app.get("/")
@@ -101,8 +157,7 @@ async def index():
     return FileResponse(Path(__file__).parent / "static" / "index.html")
 
 
-@app.get("/api/adapters")
-async def list_adapters():
+def _adapters_info() -> dict:
     result = {}
     for key, cls in ADAPTERS.items():
         adapter = cls()
@@ -116,6 +171,20 @@ async def list_adapters():
     return result
 
 
+# The adapter registry and its schemas are fixed for the life of the process, so
+# the response body is serialized once, on first request (not at import, which
+# would defeat the registry's lazy adapter imports)
+_adapters_body: Optional[bytes] = None
+
+
+@app.get("/api/adapters")
+async def list_adapters():
+    global _adapters_body
+    if _adapters_body is None:
+        _adapters_body = orjson.dumps(_adapters_info())
+    return Response(_adapters_body, media_type="application/json")
+
+
 @app.get("/api/scoring/weights")
 async def get_weights():
     return ranker.weights
@@ -138,11 +207,11 @@ async def trigger_run(request: RunRequest, background_tasks: BackgroundTasks):
     """Trigger a pipeline run asynchronously. Returns run_id immediately."""
     enabled_adapters = request.adapters or list(ADAPTERS.keys())
     run_id = f"run_{int(time.time())}"
-    await db.save_run(run_id, "running", time.time(), adapters_used=enabled_adapters, campaign=request.campaign)
+    await db.save_run(run_id, "queued", time.time(), adapters_used=enabled_adapters, campaign=request.campaign)
     background_tasks.add_task(
         _execute_pipeline, run_id, enabled_adapters, request.adapter_configs, request.weights, request.campaign
     )
-    return {"run_id": run_id, "status": "running"}
+    return {"run_id": run_id, "status": "queued"}
 
 
 @app.get("/api/runs/{run_id}/status")
@@ -160,26 +229,57 @@ async def get_run(run_id: str):
 
 
 @app.get("/api/prospects")
-async def all_prospects():
-    """Get all prospects across all runs, deduped."""
-    return await db.get_all_prospects()
+async def all_prospects(source: Optional[str] = None, category: Optional[str] = None,
+                        min_score: Optional[float] = None, limit: Optional[int] = None,
+                        offset: Optional[int] = None):
+    """Get all prospects across all runs, deduped, optionally filtered and paged in SQL."""
+    rows = await db.get_all_prospects(source=source, category=category, min_score=min_score,
+                                      limit=limit, offset=offset)
+    # Rows are already plain JSON types: encode directly and skip FastAPI's
+    # recursive jsonable_encoder pass, the slow part for a large list
+    return Response(orjson.dumps(rows), media_type="application/json")
 
 
 @app.post("/api/prospects/{prospect_id}/outreach")
-async def generate_outreach(prospect_id: int):
+async def generate_outreach(prospect_id: int, force_refresh: bool = False):
     prospect = await db.get_prospect_by_id(prospect_id)
     if not prospect:
         return {"error": "Prospect not found"}
     # Determine campaign from the run this prospect belongs to
     campaign = await db.get_run_campaign(prospect.get("run_id", ""))
-    message, deep_profile = await outreach_gen.generate(prospect, campaign=campaign)
+    message, deep_profile = await outreach_gen.generate(prospect, campaign=campaign, force_refresh=force_refresh)
     await db.update_prospect_outreach(prospect_id, message, deep_profile)
+    _invalidate_stats()
     return {"message": message, "deep_profile": deep_profile}
 
 
+@app.post("/api/runs/{run_id}/outreach")
+async def generate_run_outreach(run_id: str, limit: Optional[int] = None):
+    """Generate outreach for a run's prospects (top `limit` by score), researched concurrently."""
+    prospects = await db.get_run_prospects(run_id)
+    if limit is not None:
+        prospects = prospects[:limit]
+    campaign = await db.get_run_campaign(run_id)
+    results = []
+    for prospect, result in zip(prospects, await outreach_gen.generate_batch(prospects, campaign=campaign)):
+        if isinstance(result, Exception):
+            results.append({"prospect_id": prospect["id"], "error": str(result)})
+            continue
+        message, deep_profile = result
+        await db.update_prospect_outreach(prospect["id"], message, deep_profile)
+        results.append({"prospect_id": prospect["id"], "message": message, "deep_profile": deep_profile})
+    _invalidate_stats()
+    return results
+
+
 @app.websocket("/ws/run")
 async def run_pipeline(ws: WebSocket):
     await ws.accept()
+
+    async def send(message: dict):
+        # ws.send_json, but orjson-encoded; still a text frame so the client is unchanged
+        await ws.send_text(orjson.dumps(message).decode())
+
     try:
         config = await ws.receive_json()
         enabled_adapters = config.get("adapters", list(ADAPTERS.keys()))
@@ -188,15 +288,15 @@ async def run_pipeline(ws: WebSocket):
         campaign = config.get("campaign", "memex")
 
         run_id = f"run_{int(time.time())}"
-        await db.save_run(run_id, "running", time.time(), adapters_used=enabled_adapters, campaign=campaign)
-        await ws.send_json({"type": "run_started", "run_id": run_id})
+        await db.save_run(run_id, "queued", time.time(), adapters_used=enabled_adapters, campaign=campaign)
+        await send({"type": "run_started", "run_id": run_id})
 
         saved = await _execute_pipeline(
             run_id, enabled_adapters, adapter_configs, weight_overrides,
-            campaign=campaign, progress_cb=ws.send_json,
+            campaign=campaign, progress_cb=send,
         )
 
-        await ws.send_json({
+        await send({
             "type": "run_done",
             "run_id": run_id,
             "total": len(saved),
@@ -208,7 +308,7 @@ async def run_pipeline(ws: WebSocket):
         pass
     except Exception as e:
         try:
-            await ws.send_json({"type": "error", "message": str(e)})
+            await send({"type": "error", "message": str(e)})
         except Exception:
             pass
 
@@ -473,6 +573,7 @@ h2 {
 
 <script>
 let charts = {};
+let els = null;  // nodes updated in place on each refresh, set by mountOnce()
 
 function fmtNum(n) {
     if (typeof n !== 'number' || isNaN(n)) return '\u2014';
@@ -491,12 +592,10 @@ function signPrefix(n) {
     return n > 0 ? '+' : '';
 }
 
-function renderStatusPills(summary) {
-    return `<div class="status-bar">
-        <div class="status-pill"><span class="dot dot-green"></span>${fmtNum(summary.total_prospects)} prospects</div>
-        <div class="status-pill"><span class="dot dot-blue"></span>${fmtNum(summary.total_outreach)} outreach generated</div>
-        <div class="status-pill"><span class="dot dot-yellow"></span>${fmtNum(summary.total_runs)} pipeline runs</div>
-    </div>`;
+function updateStatusPills(summary) {
+    els.statusProspects.textContent = fmtNum(summary.total_prospects);
+    els.statusOutreach.textContent = fmtNum(summary.total_outreach);
+    els.statusRuns.textContent = fmtNum(summary.total_runs);
 }
 
 function renderPvaCard(label, color, metrics, unit) {
@@ -545,42 +644,36 @@ function renderPositionOnlyCard(label, color, value, unit) {
     </div>`;
 }
 
-function renderAccelChart(prospectMetrics, runMetrics) {
-    const pDaily = prospectMetrics.daily || [];
-    const rDaily = runMetrics.daily || [];
-
-    if (!pDaily.length && !rDaily.length) {
-        return '<div class="chart-section"><div style="color:#555;text-align:center;padding:40px">No daily data yet</div></div>';
-    }
-
-    return `<div class="chart-section">
-        <div style="font-size:0.85em;color:#5c6bc0;font-weight:600;margin-bottom:12px">ACCELERATION OVER TIME</div>
-        <div class="chart-container"><canvas id="accelChart"></canvas></div>
-    </div>`;
-}
-
 function updateAccelChart(prospectMetrics, runMetrics) {
-    const canvas = document.getElementById('accelChart');
-    if (!canvas) return;
-
     const pDaily = prospectMetrics.daily || [];
     const rDaily = runMetrics.daily || [];
 
-    const allDatesSet = new Set();
-    pDaily.forEach(d => allDatesSet.add(d.date));
-    rDaily.forEach(d => allDatesSet.add(d.date));
-    const allDates = [...allDatesSet].sort();
-    if (!allDates.length) return;
-
-    const pMap = {};
-    pDaily.forEach(d => pMap[d.date] = d.acceleration);
-    const rMap = {};
-    rDaily.forEach(d => rMap[d.date] = d.acceleration);
+    // Both series come back sorted by date, so one merge pass lays them out
+    // on the shared date axis without a Set, a sort or per-date maps
+    const n = pDaily.length + rDaily.length;
+    els.accelEmpty.style.display = n ? 'none' : '';
+    els.accelChart.style.display = n ? '' : 'none';
+    if (!n) return;
+    const allDates = [];
+    const pAccel = new Float64Array(n);
+    const rAccel = new Float64Array(n);
+    let i = 0, j = 0;
+    while (i < pDaily.length || j < rDaily.length) {
+        const pDate = i < pDaily.length ? pDaily[i].date : null;
+        const rDate = j < rDaily.length ? rDaily[j].date : null;
+        const date = rDate === null || (pDate !== null && pDate <= rDate) ? pDate : rDate;
+        const k = allDates.length;
+        allDates.push(date);
+        if (pDate === date) pAccel[k] = pDaily[i++].acceleration;
+        if (rDate === date) rAccel[k] = rDaily[j++].acceleration;
+    }
+    const pData = pAccel.subarray(0, allDates.length);
+    const rData = rAccel.subarray(0, allDates.length);
 
     const datasets = [
         {
             label: 'Prospects Accel',
-            data: allDates.map(d => pMap[d] || 0),
+            data: pData,
             borderColor: '#4ade80',
             backgroundColor: '#4ade8022',
             borderWidth: 2,
@@ -591,7 +684,7 @@ function updateAccelChart(prospectMetrics, runMetrics) {
         },
         {
             label: 'Runs Accel',
-            data: allDates.map(d => rMap[d] || 0),
+            data: rData,
             borderColor: '#7c8aff',
             backgroundColor: '#7c8aff22',
             borderWidth: 2,
@@ -609,7 +702,7 @@ function updateAccelChart(prospectMetrics, runMetrics) {
         return;
     }
 
-    charts.accel = new Chart(canvas, {
+    charts.accel = new Chart(els.accelCanvas, {
         type: 'line',
         data: { labels: allDates, datasets },
         options: {
@@ -641,62 +734,60 @@ function updateAccelChart(prospectMetrics, runMetrics) {
     });
 }
 
-function renderSourceBreakdown(bySource) {
-    if (!bySource || !bySource.length) return '<div style="color:#555;font-size:0.85em">No source data</div>';
-
-    const maxCount = Math.max(...bySource.map(s => s.count));
-    const sourceColors = {
-        github: '#4ade80',
-        twitter: '#60a5fa',
-        hackernews: '#fbbf24',
-        bootcamp: '#a78bfa',
-    };
+const SOURCE_COLORS = {
+    github: '#4ade80',
+    twitter: '#60a5fa',
+    hackernews: '#fbbf24',
+    bootcamp: '#a78bfa',
+};
+
+// Reuses the existing bar rows, adding or dropping rows only when the number
+// of sources/categories changes, and rewrites their text and widths in place.
+function updateBars(container, items, labelKey, colorOf, emptyText) {
+    if (!items || !items.length) {
+        container.innerHTML = `<div style="color:#555;font-size:0.85em">${emptyText}</div>`;
+        return;
+    }
+    if (!container.querySelector('.bar-row')) container.textContent = '';
+
+    const rows = container.children;
+    while (rows.length > items.length) container.lastElementChild.remove();
+    while (rows.length < items.length) {
+        container.insertAdjacentHTML('beforeend', `<div class="bar-row">
+            <div class="bar-label"></div>
+            <div class="bar-track"><div class="bar-fill"></div></div>
+            <div class="bar-value"></div>
+        </div>`);
+    }
 
-    return bySource.map(s => {
+    const maxCount = Math.max(...items.map(s => s.count));
+    items.forEach((s, i) => {
+        const [label, track, value] = rows[i].children;
+        const fill = track.firstElementChild;
         const pct = maxCount > 0 ? (s.count / maxCount * 100) : 0;
-        const color = sourceColors[s.source] || '#7c8aff';
         const avgScore = typeof s.avg_score === 'number' ? s.avg_score.toFixed(3) : '\u2014';
-        return `<div class="bar-row">
-            <div class="bar-label">${s.source}</div>
-            <div class="bar-track">
-                <div class="bar-fill" style="width:${pct}%;background:${color}"></div>
-            </div>
-            <div class="bar-value">${fmtNum(s.count)} <span style="color:#555;font-size:0.85em">avg ${avgScore}</span></div>
-        </div>`;
-    }).join('');
+        label.textContent = s[labelKey];
+        fill.style.width = pct + '%';
+        fill.style.background = colorOf(s);
+        value.innerHTML = `${fmtNum(s.count)} <span style="color:#555;font-size:0.85em">avg ${avgScore}</span>`;
+    });
 }
 
-function renderCategoryBreakdown(byCategory) {
-    if (!byCategory || !byCategory.length) return '<div style="color:#555;font-size:0.85em">No category data</div>';
-
-    const maxCount = Math.max(...byCategory.map(c => c.count));
-
-    return byCategory.map(c => {
-        const pct = maxCount > 0 ? (c.count / maxCount * 100) : 0;
-        const avgScore = typeof c.avg_score === 'number' ? c.avg_score.toFixed(3) : '\u2014';
-        return `<div class="bar-row">
-            <div class="bar-label">${c.category}</div>
-            <div class="bar-track">
-                <div class="bar-fill" style="width:${pct}%;background:#5c6bc0"></div>
-            </div>
-            <div class="bar-value">${fmtNum(c.count)} <span style="color:#555;font-size:0.85em">avg ${avgScore}</span></div>
-        </div>`;
-    }).join('');
+function updateSourceBreakdown(bySource) {
+    updateBars(els.sourceBreakdown, bySource, 'source',
+               s => SOURCE_COLORS[s.source] || '#7c8aff', 'No source data');
 }
 
-function renderScoreDistChart(scoreDist) {
-    if (!scoreDist || !scoreDist.length) {
-        return '<div style="color:#555;font-size:0.85em">No score data</div>';
-    }
-
-    return `<div class="chart-section">
-        <div class="chart-container" style="height:200px"><canvas id="scoreChart"></canvas></div>
-    </div>`;
+function updateCategoryBreakdown(byCategory) {
+    updateBars(els.categoryBreakdown, byCategory, 'category',
+               () => '#5c6bc0', 'No category data');
 }
 
 function updateScoreChart(scoreDist) {
-    const canvas = document.getElementById('scoreChart');
-    if (!canvas || !scoreDist || !scoreDist.length) return;
+    const hasData = !!(scoreDist && scoreDist.length);
+    els.scoreEmpty.style.display = hasData ? 'none' : '';
+    els.scoreChart.style.display = hasData ? '' : 'none';
+    if (!hasData) return;
 
     const labels = scoreDist.map(b => b.bucket);
     const values = scoreDist.map(b => b.count);
@@ -709,7 +800,7 @@ function updateScoreChart(scoreDist) {
         return;
     }
 
-    charts.score = new Chart(canvas, {
+    charts.score = new Chart(els.scoreCanvas, {
         type: 'bar',
         data: {
             labels,
@@ -783,48 +874,77 @@ function renderDailyTable(prospectMetrics, runMetrics) {
     </table>`;
 }
 
-function render(data) {
+// The page skeleton, including both canvases, is built once. Refreshes only
+// touch the nodes below, so Chart.js keeps drawing into the same canvases and
+// each chart update is a plain update('none').
+function mountOnce() {
     const el = document.getElementById('app');
-    document.getElementById('refresh-info').textContent =
-        'Last: ' + new Date().toLocaleTimeString() + ' \u2014 refreshes every 30s';
-
-    const summary = data.summary;
-    const pm = data.prospect_metrics;
-    const rm = data.run_metrics;
-
     el.innerHTML = `
-        ${renderStatusPills(summary)}
+        <div class="status-bar">
+            <div class="status-pill"><span class="dot dot-green"></span><span id="statusProspects"></span> prospects</div>
+            <div class="status-pill"><span class="dot dot-blue"></span><span id="statusOutreach"></span> outreach generated</div>
+            <div class="status-pill"><span class="dot dot-yellow"></span><span id="statusRuns"></span> pipeline runs</div>
+        </div>
 
         <h2>PVA Overview</h2>
-        <div class="accel-grid">
-            ${renderPvaCard('Prospects Found', '#4ade80', pm, 'total found')}
-            ${renderPvaCard('Pipeline Runs', '#7c8aff', rm, 'total runs')}
-            ${renderPositionOnlyCard('Outreach Generated', '#fbbf24', summary.total_outreach, 'messages generated')}
-        </div>
+        <div class="accel-grid" id="pvaGrid"></div>
 
-        ${renderAccelChart(pm, rm)}
+        <div class="chart-section">
+            <div id="accelEmpty" style="color:#555;text-align:center;padding:40px">No daily data yet</div>
+            <div id="accelChart">
+                <div style="font-size:0.85em;color:#5c6bc0;font-weight:600;margin-bottom:12px">ACCELERATION OVER TIME</div>
+                <div class="chart-container"><canvas id="accelCanvas"></canvas></div>
+            </div>
+        </div>
 
         <h2>Source Breakdown</h2>
-        <div style="margin-top:12px">
-            ${renderSourceBreakdown(summary.by_source)}
-        </div>
+        <div style="margin-top:12px" id="sourceBreakdown"></div>
 
         <h2>Category Breakdown</h2>
-        <div style="margin-top:12px">
-            ${renderCategoryBreakdown(summary.by_category)}
-        </div>
+        <div style="margin-top:12px" id="categoryBreakdown"></div>
 
         <h2>Score Distribution</h2>
-        ${renderScoreDistChart(summary.score_distribution)}
+        <div id="scoreEmpty" style="color:#555;font-size:0.85em">No score data</div>
+        <div class="chart-section" id="scoreChart">
+            <div class="chart-container" style="height:200px"><canvas id="scoreCanvas"></canvas></div>
+        </div>
 
         <h2>Daily Acceleration (Last 5 Days)</h2>
-        ${renderDailyTable(pm, rm)}
+        <div id="dailyTable"></div>
     `;
 
-    requestAnimationFrame(() => {
-        updateAccelChart(pm, rm);
-        updateScoreChart(summary.score_distribution);
-    });
+    els = {};
+    for (const id of ['statusProspects', 'statusOutreach', 'statusRuns', 'pvaGrid',
+                      'accelEmpty', 'accelChart', 'accelCanvas',
+                      'sourceBreakdown', 'categoryBreakdown',
+                      'scoreEmpty', 'scoreChart', 'scoreCanvas', 'dailyTable']) {
+        els[id] = document.getElementById(id);
+    }
+}
+
+function updateDynamic(data) {
+    const summary = data.summary;
+    const pm = data.prospect_metrics;
+    const rm = data.run_metrics;
+
+    updateStatusPills(summary);
+    els.pvaGrid.innerHTML =
+        renderPvaCard('Prospects Found', '#4ade80', pm, 'total found')
+        + renderPvaCard('Pipeline Runs', '#7c8aff', rm, 'total runs')
+        + renderPositionOnlyCard('Outreach Generated', '#fbbf24', summary.total_outreach, 'messages generated');
+    updateAccelChart(pm, rm);
+    updateSourceBreakdown(summary.by_source);
+    updateCategoryBreakdown(summary.by_category);
+    updateScoreChart(summary.score_distribution);
+    els.dailyTable.innerHTML = renderDailyTable(pm, rm);
+}
+
+function render(data) {
+    document.getElementById('refresh-info').textContent =
+        'Last: ' + new Date().toLocaleTimeString() + ' \u2014 refreshes every 30s';
+
+    if (!els) mountOnce();
+    updateDynamic(data);
 }
 
 async function refresh() {
@@ -843,24 +963,42 @@ setInterval(refresh, 30000);
 </body>
 </html>"""
 
+# The stats shell is fixed at import (the page polls /api/stats for data), so
+# it's encoded, gzipped and tagged once; refreshes revalidate to a 304. The tag
+# is weak because the gzipped and plain bodies share it.
+_STATS_BYTES = STATS_HTML.encode()
+_STATS_GZIP = gzip.compress(_STATS_BYTES, compresslevel=9)
+_STATS_ETAG = f'W/"{hashlib.blake2b(_STATS_BYTES, digest_size=8).hexdigest()}"'
+_STATS_HEADERS = {"ETag": _STATS_ETAG, "Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+
 
-def compute_pva(daily_counts: list[dict]) -> dict:
-    """Compute position, velocity, acceleration from daily {date, count} list."""
-    if not daily_counts:
+def compute_pva(dates: list[str], counts: list[int]) -> dict:
+    """Compute position, velocity, acceleration from parallel daily date and count lists."""
+    if not counts:
         return {"position": 0, "velocity": 0, "acceleration": 0, "daily": []}
 
     result = []
     cumulative = 0
-    for i, d in enumerate(daily_counts):
-        cumulative += d["count"]
-        velocity = sum(x["count"] for x in daily_counts[max(0,i-6):i+1]) / min(i+1, 7)
-        prev_velocity = 0
-        if i >= 1:
-            prev_velocity = sum(x["count"] for x in daily_counts[max(0,i-7):i]) / min(i, 7)
+    # Running 7-day window sum: add today, drop the day that fell out. The
+    # previous day's velocity is exactly yesterday's window average, so it's
+    # carried over rather than re-summed. The first week (window still
+    # filling, nothing dropped) and the rest (fixed 7-day span) are zipped up
+    # front as (day, count, dropped, span), so the loop has no branch or min().
+    steps = chain(
+        zip(dates[:7], counts[:7], repeat(0), range(1, 8)),
+        zip(dates[7:], counts[7:], counts, repeat(7)),
+    )
+    window = 0
+    velocity = 0
+    for day, count, dropped, span in steps:
+        cumulative += count
+        window += count - dropped
+        prev_velocity = velocity
+        velocity = window / span
         acceleration = velocity - prev_velocity
         result.append({
-            "date": d["date"],
-            "value": d["count"],
+            "date": day,
+            "value": count,
             "cumulative": cumulative,
             "velocity": round(velocity, 2),
             "acceleration": round(acceleration, 2),
@@ -874,22 +1012,46 @@ def compute_pva(daily_counts: list[dict]) -> dict:
     }
 
 
+# Every open dashboard polls /api/stats; within STATS_TTL they all get one
+# computed, pre-encoded body. Runs and outreach drop it so their counts show up.
+STATS_TTL = 5.0
+_stats_cache: Optional[tuple] = None  # (computed_at, body)
+_stats_lock = asyncio.Lock()
+
+
+def _invalidate_stats():
+    global _stats_cache
+    _stats_cache = None
+
+
 @app.get("/api/stats")
 async def get_stats():
-    summary = await db.get_stats_summary()
-    daily_prospects = await db.get_daily_prospect_counts()
-    daily_runs = await db.get_daily_run_counts()
-
-    return {
-        "summary": summary,
-        "prospect_metrics": compute_pva(daily_prospects),
-        "run_metrics": compute_pva(daily_runs),
-    }
+    global _stats_cache
+    # Held while computing, so concurrent misses wait for one result instead of each querying
+    async with _stats_lock:
+        if _stats_cache is None or time.monotonic() - _stats_cache[0] >= STATS_TTL:
+            summary, daily_prospects, daily_runs = await asyncio.gather(
+                db.get_stats_summary(), db.get_daily_prospect_counts(), db.get_daily_run_counts(),
+            )
+            body = orjson.dumps({
+                "summary": summary,
+                "prospect_metrics": compute_pva(*daily_prospects),
+                "run_metrics": compute_pva(*daily_runs),
+            })
+            _stats_cache = (time.monotonic(), body)
+        body = _stats_cache[1]
+    return Response(body, media_type="application/json")
 
 
 @app.get("/stats", response_class=HTMLResponse)
-async def stats_page():
-    return STATS_HTML
+async def stats_page(request: Request):
+    if _STATS_ETAG in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=_STATS_HEADERS)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        # GZipMiddleware passes responses with a Content-Encoding through untouched
+        # (Starlette >= 0.22; requirements.txt pins starlette>=0.27)
+        return HTMLResponse(_STATS_GZIP, headers={**_STATS_HEADERS, "Content-Encoding": "gzip"})
+    return HTMLResponse(_STATS_BYTES, headers=_STATS_HEADERS)
 
 
 app.mount("/static", StaticFiles(directory=Path(__file__).parent / "static"), name="static")